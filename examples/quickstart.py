@@ -67,13 +67,18 @@ const API = '';
 let deviceId = null;
 let userId = null;
 
+// Native base64url codecs where supported; regex/atob fallback elsewhere.
+const B64URL = {alphabet: 'base64url', omitPadding: true};
 function b64url(buf) {
-    return btoa(String.fromCharCode(...new Uint8Array(buf)))
+    const bytes = new Uint8Array(buf);
+    if (bytes.toBase64) return bytes.toBase64(B64URL);
+    return btoa(String.fromCharCode(...bytes))
         .replace(/\\+/g,'-').replace(/\\//g,'_').replace(/=+$/,'');
 }
 function b64urlDecode(s) {
+    if (Uint8Array.fromBase64) return Uint8Array.fromBase64(s, B64URL);
     s = s.replace(/-/g,'+').replace(/_/g,'/');
-    while(s.length%4) s+='=';
+    s += '='.repeat((4 - s.length % 4) % 4);
     return Uint8Array.from(atob(s), c=>c.charCodeAt(0));
 }
 function log(msg) { document.getElementById('output').textContent += msg + '\\n'; }
@@ -155,10 +160,20 @@ document.getElementById('add').onclick = addPasskey;
 </body></html>"""
 
 
-from fastapi.responses import HTMLResponse  # noqa: E402
+import hashlib  # noqa: E402
+
+from fastapi import Request  # noqa: E402
+from fastapi.responses import HTMLResponse, Response  # noqa: E402
+
+# The demo page is static: encode it once and let browsers revalidate with an ETag.
+_DEMO_BYTES = PASSKEY_DEMO_HTML.encode("utf-8")
+_DEMO_ETAG = '"' + hashlib.blake2b(_DEMO_BYTES, digest_size=8).hexdigest() + '"'
+_DEMO_HEADERS = {"ETag": _DEMO_ETAG, "Cache-Control": "public, max-age=300"}
 
 
 @app.get("/passkey-demo", response_class=HTMLResponse)
-def passkey_demo():
+async def passkey_demo(request: Request):
     """Minimal browser UI for testing passkey registration, login, and add."""
-    return PASSKEY_DEMO_HTML
+    if _DEMO_ETAG in request.headers.get("if-none-match", ""):
+        return Response(status_code=304, headers=_DEMO_HEADERS)
+    return HTMLResponse(_DEMO_BYTES, headers=_DEMO_HEADERS)
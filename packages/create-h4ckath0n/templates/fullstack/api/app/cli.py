@@ -2,9 +2,27 @@
 
 from __future__ import annotations
 
+import contextlib
 import os
+import signal
 import subprocess
 import sys
+import time
+
+# On POSIX each dev server gets its own process group so shutdown can signal
+# the whole tree (npm -> vite, uvicorn -> reloader -> worker) at once.
+_POSIX = os.name == "posix"
+# On Windows the equivalent is a new process group, which CTRL_BREAK_EVENT
+# reaches as a whole.
+if sys.platform == "win32":
+    _CREATIONFLAGS = subprocess.CREATE_NEW_PROCESS_GROUP
+else:
+    _CREATIONFLAGS = 0
+
+# Largest WebSocket message uvicorn accepts, in bytes. Oversized messages are
+# rejected while reading, before the app buffers or decodes them; the demo
+# handler's own 64 Ki-character check stays as a fallback.
+_WS_MAX_SIZE = 64 * 1024
 
 
 def main() -> None:
@@ -39,12 +57,29 @@ def _cmd_dev() -> None:
     print(f"  Web: http://localhost:5173 (from {web_dir})")
     print()
 
-    processes = []
+    if _POSIX:
+        # Children run in their own sessions, so route SIGTERM through the same
+        # shutdown path as Ctrl-C instead of orphaning them.
+        signal.signal(signal.SIGTERM, _raise_keyboard_interrupt)
+
+    processes: list[subprocess.Popen[bytes]] = []
     try:
         # Start API server
         api_proc = subprocess.Popen(
-            [sys.executable, "-m", "uvicorn", "app.main:app", "--reload", "--port", "8000"],
+            [
+                sys.executable,
+                "-m",
+                "uvicorn",
+                "app.main:app",
+                "--reload",
+                "--port",
+                "8000",
+                "--ws-max-size",
+                str(_WS_MAX_SIZE),
+            ],
             cwd=api_dir,
+            start_new_session=_POSIX,
+            creationflags=_CREATIONFLAGS,
         )
         processes.append(api_proc)
 
@@ -53,33 +88,101 @@ def _cmd_dev() -> None:
         frontend_proc = subprocess.Popen(
             [npm_cmd, "run", "dev"],
             cwd=web_dir,
+            start_new_session=_POSIX,
+            creationflags=_CREATIONFLAGS,
         )
         processes.append(frontend_proc)
 
-        # Wait for any process to exit
-        for proc in processes:
-            proc.wait()
+        # Wait until either process exits, then shut the other one down.
+        _wait_for_first_exit(processes)
     except KeyboardInterrupt:
         print("\nShutting down...")
     finally:
-        for proc in processes:
-            try:
-                proc.terminate()
-                proc.wait(timeout=5)
-            except (subprocess.TimeoutExpired, OSError):
+        _stop_processes(processes)
+
+
+def _wait_for_first_exit(processes: list[subprocess.Popen[bytes]]) -> None:
+    """Block until any of *processes* exits."""
+    if not _POSIX:
+        while all(proc.poll() is None for proc in processes):
+            time.sleep(0.2)
+        return
+    # Sleep in the kernel until a child exits instead of waking up to poll.
+    # The dev servers are our only direct children, so any reaped pid is one
+    # of them; record its status so Popen does not try to reap it again.
+    by_pid = {proc.pid: proc for proc in processes}
+    while True:
+        pid, status = os.waitpid(-1, 0)
+        proc = by_pid.get(pid)
+        if proc is not None:
+            proc.returncode = os.waitstatus_to_exitcode(status)
+            return
+
+
+def _raise_keyboard_interrupt(signum: int, frame: object) -> None:
+    raise KeyboardInterrupt
+
+
+def _stop_processes(processes: list[subprocess.Popen[bytes]], timeout: float = 5) -> None:
+    """Terminate all dev server process trees, killing any that outlive *timeout*."""
+    for proc in processes:
+        _signal_tree(proc, force=False)
+    deadline = time.monotonic() + timeout
+    for proc in processes:
+        while _tree_alive(proc) and time.monotonic() < deadline:
+            time.sleep(0.1)
+        if _tree_alive(proc):
+            _signal_tree(proc, force=True)
+        proc.wait()
+
+
+def _tree_alive(proc: subprocess.Popen[bytes]) -> bool:
+    """Return whether *proc* or, on POSIX, anything left in its process group is running."""
+    # poll() also reaps an exited leader so it does not linger in its group as a zombie.
+    if proc.poll() is None:
+        return True
+    if sys.platform == "win32":
+        return False
+    try:
+        os.killpg(proc.pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+def _signal_tree(proc: subprocess.Popen[bytes], *, force: bool) -> None:
+    """Send SIGTERM (or SIGKILL when *force*) to *proc* and its process group."""
+    if sys.platform == "win32":
+        if proc.poll() is not None:
+            return
+        try:
+            if force:
                 proc.kill()
+            else:
+                proc.send_signal(signal.CTRL_BREAK_EVENT)
+        except OSError:
+            pass
+    else:
+        # Signal the group even if the leader has exited: its descendants (the
+        # uvicorn worker, node/vite under npm) may still be running and holding ports.
+        with contextlib.suppress(ProcessLookupError):
+            os.killpg(proc.pid, signal.SIGKILL if force else signal.SIGTERM)
 
 
 def _find_project_root() -> str:
     """Find the project root by looking for api/ and web/ directories."""
-    # Start from the current working directory
+    # Check the current working directory, then the parent of api/.
     cwd = os.getcwd()
-    if os.path.isdir(os.path.join(cwd, "api")) and os.path.isdir(os.path.join(cwd, "web")):
-        return cwd
-    # Try parent of api/
-    parent = os.path.dirname(cwd)
-    if os.path.isdir(os.path.join(parent, "api")) and os.path.isdir(os.path.join(parent, "web")):
-        return parent
+    for base in (cwd, os.path.dirname(cwd)):
+        try:
+            with os.scandir(base) as entries:
+                dirs = {entry.name for entry in entries if entry.is_dir()}
+        except OSError:
+            continue
+        if {"api", "web"} <= dirs:
+            return base
     # Default to cwd
     return cwd
 
@@ -3,14 +3,15 @@
 import asyncio
 import contextlib
 import json
+import time
 from datetime import UTC, datetime
 
 from fastapi import WebSocket, WebSocketDisconnect
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from starlette.requests import Request
 from starlette.responses import JSONResponse
 
-from app.middleware import add_csp_middleware
+from app.middleware import add_csp_middleware, add_static_response_cache
 from h4ckath0n import create_app
 from h4ckath0n.realtime import (
     AuthError,
@@ -20,21 +21,44 @@ from h4ckath0n.realtime import (
 )
 
 app = create_app()
+add_static_response_cache(app, ("/healthz", "/health", "/demo/ping"))
 add_csp_middleware(app)
 
+# Server timestamps only need millisecond resolution, so frames emitted within the
+# same 50 ms window share one formatted string instead of each formatting their own.
+_SERVER_TIME_TTL = 0.05
+_server_time_cache: tuple[float, str] = (0.0, "")
+
+
+def _server_time() -> str:
+    """Return the current UTC time as an ISO 8601 string (millisecond precision)."""
+    global _server_time_cache
+    now = time.time()
+    cached_at, value = _server_time_cache
+    if 0.0 <= now - cached_at < _SERVER_TIME_TTL:
+        return value
+    value = datetime.fromtimestamp(now, UTC).isoformat(timespec="milliseconds")
+    _server_time_cache = (now, value)
+    return value
+
 
 class HealthzResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     status: str = Field(..., description="Health check status.")
 
 
+_HEALTHZ_OK = HealthzResponse(status="ok")
+
+
 @app.get(
     "/healthz",
     response_model=HealthzResponse,
     summary="Health check",
     description="Readiness check for E2E and deployment probes.",
 )
-def healthz() -> HealthzResponse:
-    return HealthzResponse(status="ok")
+async def healthz() -> HealthzResponse:
+    return _HEALTHZ_OK
 
 
 # ---------------------------------------------------------------------------
@@ -44,6 +68,8 @@ def healthz() -> HealthzResponse:
 
 
 class PingResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     ok: bool = Field(..., description="True when the service is reachable.")
 
 
@@ -52,10 +78,15 @@ class EchoRequest(BaseModel):
 
 
 class EchoResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     message: str = Field(..., description="Original message.")
     reversed: str = Field(..., description="Reversed message.")
 
 
+_PING_OK = PingResponse(ok=True)
+
+
 @app.get(
     "/demo/ping",
     tags=["demo"],
@@ -63,8 +94,8 @@ class EchoResponse(BaseModel):
     summary="Demo ping",
     description="Simple liveness ping for the demo namespace.",
 )
-def demo_ping() -> PingResponse:
-    return PingResponse(ok=True)
+async def demo_ping() -> PingResponse:
+    return _PING_OK
 
 
 @app.post(
@@ -74,8 +105,9 @@ def demo_ping() -> PingResponse:
     summary="Demo echo",
     description="Echo back the message along with its reverse.",
 )
-def demo_echo(body: EchoRequest) -> EchoResponse:
-    return EchoResponse(message=body.message, reversed=body.message[::-1])
+async def demo_echo(body: EchoRequest) -> EchoResponse:
+    # Both fields are already validated strings, so skip re-validation.
+    return EchoResponse.model_construct(message=body.message, reversed=body.message[::-1])
 
 
 # ---------------------------------------------------------------------------
@@ -83,6 +115,13 @@ def demo_echo(body: EchoRequest) -> EchoResponse:
 # ---------------------------------------------------------------------------
 
 
+# Frames larger than this are closed with code 1009 instead of being parsed.
+# The check runs after receive_text() has already buffered and decoded the whole
+# frame, so it only saves the json.loads; the dev CLI caps frame size in uvicorn
+# (--ws-max-size) and this stays as a second line of defence.
+_WS_MAX_MESSAGE_CHARS = 64 * 1024
+
+
 @app.websocket("/demo/ws")
 async def demo_websocket(websocket: WebSocket) -> None:
     """Authenticated WebSocket demo with heartbeat and echo.
@@ -100,13 +139,12 @@ async def demo_websocket(websocket: WebSocket) -> None:
     await websocket.accept()
 
     # Send welcome
-    now = datetime.now(UTC).isoformat()
     await websocket.send_json(
         {
             "type": "welcome",
             "user_id": ctx.user_id,
             "device_id": ctx.device_id,
-            "server_time": now,
+            "server_time": _server_time(),
         }
     )
 
@@ -118,11 +156,7 @@ async def demo_websocket(websocket: WebSocket) -> None:
                 await asyncio.sleep(2)
                 n += 1
                 await websocket.send_json(
-                    {
-                        "type": "heartbeat",
-                        "n": n,
-                        "server_time": datetime.now(UTC).isoformat(),
-                    }
+                    {"type": "heartbeat", "n": n, "server_time": _server_time()}
                 )
         except (WebSocketDisconnect, RuntimeError):
             pass
@@ -132,18 +166,21 @@ async def demo_websocket(websocket: WebSocket) -> None:
     try:
         while True:
             raw = await websocket.receive_text()
+            if len(raw) > _WS_MAX_MESSAGE_CHARS:
+                await websocket.close(code=1009, reason="message_too_big")
+                break
             try:
                 msg = json.loads(raw)
             except json.JSONDecodeError:
                 continue
-            if "message" in msg:
+            if isinstance(msg, dict) and "message" in msg:
                 text = str(msg["message"])
                 await websocket.send_json(
                     {
                         "type": "echo",
                         "message": text,
                         "reversed": text[::-1],
-                        "server_time": datetime.now(UTC).isoformat(),
+                        "server_time": _server_time(),
                     }
                 )
     except WebSocketDisconnect:
@@ -160,7 +197,7 @@ async def demo_websocket(websocket: WebSocket) -> None:
 
 
 class SSEChunk(BaseModel):
-    """Schema for SSE chunk data (for OpenAPI docs)."""
+    """Schema for SSE chunk data (OpenAPI docs and wire serialization)."""
 
     i: int = Field(..., description="Chunk index.")
     text: str = Field(..., description="Chunk text.")
@@ -168,11 +205,14 @@ class SSEChunk(BaseModel):
 
 
 class SSEDone(BaseModel):
-    """Schema for SSE done event (for OpenAPI docs)."""
+    """Schema for SSE done event (OpenAPI docs and wire serialization)."""
 
     ok: bool = Field(..., description="True when streaming completes.")
 
 
+_SSE_DONE = SSEDone(ok=True).model_dump_json()
+
+
 @app.get(
     "/demo/sse",
     tags=["demo"],
@@ -211,20 +251,13 @@ async def demo_sse(request: Request):  # type: ignore[no-untyped-def]
         "Enjoy!",
     ]
 
+    # No per-chunk disconnect polling: sse-starlette cancels the generator as
+    # soon as the client goes away.
     async def generate():  # type: ignore[no-untyped-def]
         for i, text in enumerate(chunks):
-            if await request.is_disconnected():
-                return
-            yield {
-                "event": "chunk",
-                "data": json.dumps(
-                    {"i": i, "text": text, "server_time": datetime.now(UTC).isoformat()}
-                ),
-            }
+            chunk = SSEChunk(i=i, text=text, server_time=_server_time())
+            yield {"event": "chunk", "data": chunk.model_dump_json()}
             await asyncio.sleep(0.15)
-        yield {
-            "event": "done",
-            "data": json.dumps({"ok": True}),
-        }
+        yield {"event": "done", "data": _SSE_DONE}
 
     return sse_response(generate())
@@ -3,11 +3,10 @@
 from __future__ import annotations
 
 import os
+from collections.abc import Iterable
 
 from fastapi import FastAPI
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.requests import Request
-from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 ENV_VAR = "H4CKATH0N_ENV"
 
@@ -17,39 +16,149 @@ def add_csp_middleware(app: FastAPI) -> None:
     app.add_middleware(CSPMiddleware)
 
 
-class CSPMiddleware(BaseHTTPMiddleware):
-    """Set Content-Security-Policy headers based on environment."""
+def add_static_response_cache(app: FastAPI, paths: Iterable[str]) -> None:
+    """Serve fixed-output GET routes from a snapshot of their first response.
 
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
-        response = await call_next(request)
-        env = os.getenv(ENV_VAR, "development")
-        if env == "production":
-            csp = (
-                "default-src 'self'; "
-                "script-src 'self'; "
-                "style-src 'self'; "
-                "img-src 'self' data:; "
-                "font-src 'self'; "
-                "connect-src 'self' wss:; "
-                "frame-ancestors 'none'; "
-                "base-uri 'self'; "
-                "form-action 'self'"
-            )
-        else:
-            # Development: allow Vite dev server
-            csp = (
-                "default-src 'self' http://localhost:*; "
-                "script-src 'self' http://localhost:*; "
-                "style-src 'self' 'unsafe-inline' http://localhost:*; "
-                "img-src 'self' data: http://localhost:*; "
-                "font-src 'self' http://localhost:*; "
-                "connect-src 'self' http://localhost:* ws://localhost:*; "
-                "frame-ancestors 'none'; "
-                "base-uri 'self'; "
-                "form-action 'self'"
+    Only the status, body and content headers are replayed.  Middleware that
+    adds headers of its own (security headers, ``X-Trace-Id`` from
+    ``init_observability``) must be registered *after* this call so it wraps
+    the cache and runs on every response, cached or not.
+    """
+    app.add_middleware(StaticResponseCache, paths=frozenset(paths))
+
+
+# Headers that describe the body itself; everything else is per-response and
+# left to the middleware wrapping the cache.
+_CONTENT_HEADER_NAMES = frozenset({b"content-type", b"content-length"})
+
+
+class StaticResponseCache:
+    """ASGI middleware that replays a stored response for fixed-output routes.
+
+    The first successful ``GET`` to one of ``paths`` runs through the app as
+    usual and its status, content headers and body are recorded.  Later
+    requests are answered directly from that snapshot without touching the
+    router.
+    """
+
+    def __init__(self, app: ASGIApp, paths: frozenset[str]) -> None:
+        self.app = app
+        self.paths = paths
+        self._snapshots: dict[str, tuple[int, tuple[tuple[bytes, bytes], ...], bytes]] = {}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "GET" or scope["path"] not in self.paths:
+            await self.app(scope, receive, send)
+            return
+
+        path = scope["path"]
+        if (snapshot := self._snapshots.get(path)) is not None:
+            cached_status, cached_headers, cached_body = snapshot
+            # Fresh messages each time: outer middleware may edit them in place.
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": cached_status,
+                    "headers": list(cached_headers),
+                }
             )
-        response.headers["Content-Security-Policy"] = csp
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-Frame-Options"] = "DENY"
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-        return response
+            await send({"type": "http.response.body", "body": cached_body})
+            return
+
+        # Filled from the start message before it is passed on, since outer
+        # middleware may rewrite that message's headers in place.
+        status = 0
+        headers: tuple[tuple[bytes, bytes], ...] = ()
+        chunks: list[bytes] = []
+
+        async def capture(message: Message) -> None:
+            nonlocal status, headers
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                headers = tuple(
+                    (name, value)
+                    for name, value in message.get("headers", ())
+                    if name.lower() in _CONTENT_HEADER_NAMES
+                )
+            elif message["type"] == "http.response.body" and status == 200:
+                # Streaming middleware may split the body across several messages.
+                chunks.append(bytes(message.get("body", b"")))
+                if not message.get("more_body", False):
+                    self._snapshots[path] = (status, headers, b"".join(chunks))
+            await send(message)
+
+        await self.app(scope, receive, capture)
+
+
+_CSP_PRODUCTION = (
+    "default-src 'self'; "
+    "script-src 'self'; "
+    "style-src 'self'; "
+    "img-src 'self' data:; "
+    "font-src 'self'; "
+    "connect-src 'self' wss:; "
+    "frame-ancestors 'none'; "
+    "base-uri 'self'; "
+    "form-action 'self'"
+)
+
+# Development: allow Vite dev server
+_CSP_DEVELOPMENT = (
+    "default-src 'self' http://localhost:*; "
+    "script-src 'self' http://localhost:*; "
+    "style-src 'self' 'unsafe-inline' http://localhost:*; "
+    "img-src 'self' data: http://localhost:*; "
+    "font-src 'self' http://localhost:*; "
+    "connect-src 'self' http://localhost:* ws://localhost:*; "
+    "frame-ancestors 'none'; "
+    "base-uri 'self'; "
+    "form-action 'self'"
+)
+
+
+_SECURITY_HEADER_NAMES = frozenset(
+    {b"content-security-policy", b"x-content-type-options", b"x-frame-options", b"referrer-policy"}
+)
+
+
+def _security_headers(csp: str) -> tuple[tuple[bytes, bytes], ...]:
+    return (
+        (b"content-security-policy", csp.encode("latin-1")),
+        (b"x-content-type-options", b"nosniff"),
+        (b"x-frame-options", b"DENY"),
+        (b"referrer-policy", b"strict-origin-when-cross-origin"),
+    )
+
+
+class CSPMiddleware:
+    """Set Content-Security-Policy headers based on environment.
+
+    The environment is read once, when the middleware is built at startup,
+    and the encoded header pairs are reused for every response.  Implemented
+    as plain ASGI so each response only has its start message edited,
+    without the extra task and stream ``BaseHTTPMiddleware`` adds.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        env = os.getenv(ENV_VAR, "development")
+        self.headers = _security_headers(
+            _CSP_PRODUCTION if env == "production" else _CSP_DEVELOPMENT
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", ()))
+                # Our values replace any the app set itself (rare).
+                if any(name.lower() in _SECURITY_HEADER_NAMES for name, _ in headers):
+                    headers = [h for h in headers if h[0].lower() not in _SECURITY_HEADER_NAMES]
+                headers.extend(self.headers)
+                message["headers"] = headers
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
@@ -29,7 +29,13 @@ def main() -> None:
     schema = app.openapi()
     out_path = Path(args.out)
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    out_path.write_text(json.dumps(schema, indent=2, sort_keys=True) + "\n")
+    content = (json.dumps(schema, indent=2, sort_keys=True) + "\n").encode("utf-8")
+    # Leave an up-to-date file untouched so mtime-based watchers and the
+    # TypeScript generator downstream do not see a spurious change.
+    if out_path.is_file() and out_path.read_bytes() == content:
+        print(f"OpenAPI schema unchanged at {out_path}")
+        return
+    out_path.write_bytes(content)
     print(f"OpenAPI schema written to {out_path}")
 
 
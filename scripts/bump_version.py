@@ -5,11 +5,18 @@ import argparse
 import json
 import re
 import sys
+import tomllib
 from dataclasses import dataclass
 from difflib import unified_diff
 from pathlib import Path
 
 SEMVER_RE = re.compile(r"^(0|[1-9]\d*)\.(0|[1-9]\d*)\.(0|[1-9]\d*)$")
+# The version string of the [project] table: the first `version = "..."` line
+# after the [project] header and before the next table header.
+PROJECT_VERSION_RE = re.compile(
+    r'^\s*\[project\][ \t]*\n(?:(?!\s*\[)[^\n]*\n)*?[ \t]*version[ \t]*=[ \t]*"([^"]+)"',
+    flags=re.MULTILINE,
+)
 
 
 def die(msg: str) -> None:
@@ -26,19 +33,10 @@ def write_text(p: Path, s: str) -> None:
 
 
 def parse_pyproject_version(pyproject: Path) -> str:
-    s = read_text(pyproject).splitlines()
-    in_project = False
-    for line in s:
-        m = re.match(r"^\s*\[([^\]]+)\]\s*$", line)
-        if m:
-            in_project = m.group(1).strip() == "project"
-            continue
-        if in_project:
-            vm = re.match(r'^\s*version\s*=\s*"([^"]+)"\s*$', line)
-            if vm:
-                return vm.group(1)
-    die(f"Could not find [project].version in {pyproject}")
-    return ""
+    version = tomllib.loads(read_text(pyproject)).get("project", {}).get("version")
+    if not isinstance(version, str):
+        die(f"Could not find [project].version in {pyproject}")
+    return version
 
 
 def bump_semver(old: str, bump: str) -> str:
@@ -80,30 +78,10 @@ def show_diff(ch: Change) -> str:
 
 def replace_project_version_in_pyproject(path: Path, old: str, new: str) -> Change | None:
     before = read_text(path)
-    lines = before.splitlines(keepends=True)
-
-    out: list[str] = []
-    in_project = False
-    changed = False
-    for line in lines:
-        m = re.match(r"^\s*\[([^\]]+)\]\s*$", line.strip())
-        if m:
-            in_project = m.group(1).strip() == "project"
-            out.append(line)
-            continue
-
-        if in_project:
-            vm = re.match(r'^(\s*version\s*=\s*")([^"]+)(".*)\n?$', line)
-            if vm and vm.group(2) == old:
-                out.append(f"{vm.group(1)}{new}{vm.group(3)}\n")
-                changed = True
-                continue
-
-        out.append(line)
-
-    after = "".join(out)
-    if not changed:
+    m = PROJECT_VERSION_RE.search(before)
+    if not m or m.group(1) != old:
         return None
+    after = before[: m.start(1)] + new + before[m.end(1) :]
     return Change(path, before, after)
 
 
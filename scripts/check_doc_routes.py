@@ -21,6 +21,9 @@ README = REPO_ROOT / "README.md"
 # FastAPI internal paths that we do not require in user docs.
 FRAMEWORK_PATHS = frozenset({"/openapi.json", "/docs", "/docs/oauth2-redirect", "/redoc"})
 
+# A backticked ``METHOD /path`` token, e.g. `GET /health`.
+README_ROUTE_RE = re.compile(r"`([A-Za-z]+)\s+(/[^`\s]*)`")
+
 
 def get_app_routes() -> list[tuple[str, str]]:
     """Return (method, path) pairs from the live FastAPI app."""
@@ -57,16 +60,13 @@ def check_routes_in_readme(
     matches like ``/auth/passkeys/{key_id}`` inside
     ``/auth/passkeys/{key_id}/revoke`` are not false positives.
     """
-    readme_text = README.read_text()
-    missing: list[tuple[str, str]] = []
-    for method, path in routes:
-        # Build a pattern like "GET /health" or "PATCH /auth/passkeys/\{key_id\}"
-        # that must appear as a recognisable method+path token in the README.
-        path_re = re.escape(path)
-        combined = rf"`{method}\s+{path_re}`"
-        if not re.search(combined, readme_text, re.IGNORECASE):
-            missing.append((method, path))
-    return missing
+    # Collect every documented method+path token in one pass over the README,
+    # then check routes by set membership (case-insensitive, as before).
+    documented = {
+        (method.upper(), path.lower())
+        for method, path in README_ROUTE_RE.findall(README.read_text())
+    }
+    return [(method, path) for method, path in routes if (method, path.lower()) not in documented]
 
 
 def main() -> int:
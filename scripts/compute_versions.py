@@ -14,7 +14,8 @@ SEMVER_TAG = re.compile(r"^v(?P<major>0|[1-9]\d*)\.(?P<minor>0|[1-9]\d*)\.(?P<pa
 
 
 def read_pyproject_version(path: Path) -> str:
-    data = tomllib.loads(path.read_text())
+    with path.open("rb") as handle:
+        data = tomllib.load(handle)
     return data["project"]["version"]
 
 
@@ -34,24 +35,20 @@ def format_version(version: tuple[int, int, int]) -> str:
 
 
 def latest_stable_tag() -> tuple[str, tuple[int, int, int]] | None:
+    # git sorts by version (v:refname), newest first, so the first strict
+    # vX.Y.Z tag is the latest; pre-release and other tags are skipped.
     try:
-        raw_tags = subprocess.check_output(["git", "tag"], text=True).splitlines()
+        raw_tags = subprocess.check_output(
+            ["git", "tag", "--list", "v[0-9]*", "--sort=-v:refname"], text=True
+        ).splitlines()
     except subprocess.CalledProcessError as exc:
         raise RuntimeError("Failed to read git tags") from exc
 
-    stable_tags: list[tuple[tuple[int, int, int], str]] = []
     for tag in raw_tags:
         match = SEMVER_TAG.match(tag)
-        if not match:
-            continue
-        version = (int(match["major"]), int(match["minor"]), int(match["patch"]))
-        stable_tags.append((version, tag))
-
-    if not stable_tags:
-        return None
-
-    version, tag = max(stable_tags, key=lambda item: item[0])
-    return tag, version
+        if match:
+            return tag, (int(match["major"]), int(match["minor"]), int(match["patch"]))
+    return None
 
 
 def determine_channel(channel: str | None) -> str:
@@ -80,7 +77,6 @@ def base_version_from_files(root: Path) -> tuple[int, int, int]:
 
 def compute_versions(channel: str, root: Path) -> dict[str, str]:
     now = datetime.now(UTC)
-    latest_tag = latest_stable_tag()
     tag_ref = os.environ.get("GITHUB_REF_NAME") or os.environ.get("GITHUB_REF", "")
     if "/" in tag_ref:
         tag_ref = tag_ref.rsplit("/", 1)[-1]
@@ -103,6 +99,9 @@ def compute_versions(channel: str, root: Path) -> dict[str, str]:
             "base_version": version_str,
         }
 
+    # Stable releases take their version from the tag being built, so only
+    # the pre-release channels need to look up the latest stable tag.
+    latest_tag = latest_stable_tag()
     if latest_tag:
         base_version = (latest_tag[1][0], latest_tag[1][1], latest_tag[1][2] + 1)
     else:
@@ -1,7 +1,23 @@
 """h4ckath0n - ship hackathon products fast, securely."""
 
-from h4ckath0n.app import create_app
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
 from h4ckath0n.config import Settings
 from h4ckath0n.version import __version__
 
+if TYPE_CHECKING:
+    from h4ckath0n.app import create_app
+
 __all__ = ["create_app", "Settings", "__version__"]
+
+
+def __getattr__(name: str) -> Any:
+    # The app factory pulls in FastAPI, WebAuthn and the routers; import it on
+    # first use so lighter entry points (e.g. the admin CLI) skip that cost.
+    if name == "create_app":
+        from h4ckath0n.app import create_app
+
+        return create_app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
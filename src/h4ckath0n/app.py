@@ -3,22 +3,24 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import logging
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from pydantic import BaseModel, Field
-from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from h4ckath0n.auth.passkeys.router import passkeys_router
 from h4ckath0n.auth.passkeys.router import router as passkey_router
+from h4ckath0n.auth.passkeys.service import cleanup_expired_challenges
 from h4ckath0n.config import Settings
 from h4ckath0n.db.base import Base
-from h4ckath0n.db.engine import create_async_engine_from_settings
+from h4ckath0n.db.engine import create_async_engine_from_settings, prewarm_async_pool
 from h4ckath0n.db.migrations.runtime import (
     PackagedMigrationsError,
-    get_schema_status,
+    get_schema_status_async,
     run_upgrade_to_head,
 )
 from h4ckath0n.version import __version__ as H4CKATH0N_VERSION
@@ -26,6 +28,55 @@ from h4ckath0n.version import __version__ as H4CKATH0N_VERSION
 logger = logging.getLogger(__name__)
 
 
+# Defined at module level so Pydantic builds their validators once per process
+# rather than on every create_app() call.
+class RootResponse(BaseModel):
+    message: str = Field(..., description="Welcome message.")
+
+
+class HealthResponse(BaseModel):
+    status: str = Field(..., description="Health status string.")
+
+
+# The default routes always return the same body, so serialize it once; the
+# response_model on each route still documents the schema in OpenAPI.
+_ROOT_BODY = RootResponse(message="Welcome to your h4ckath0n app!").model_dump_json().encode()
+_HEALTH_BODY = HealthResponse(status="healthy").model_dump_json().encode()
+
+
+# Connections opened during startup so early requests do not pay the Postgres
+# connect/auth handshake (the pool holds up to 10 idle connections).
+_POOL_PREWARM_CONNECTIONS = 5
+
+
+def _only_packaged_tables() -> bool:
+    """Return True if every table on ``Base`` comes from h4ckath0n's own models."""
+    packaged = {
+        table.name
+        for mapper in Base.registry.mappers
+        if mapper.class_.__module__.startswith("h4ckath0n.")
+        for table in mapper.tables
+    }
+    return packaged.issuperset(Base.metadata.tables)
+
+
+async def _sweep_expired_challenges(
+    session_factory: async_sessionmaker[AsyncSession], interval: float
+) -> None:
+    """Delete expired WebAuthn challenges every *interval* seconds until cancelled.
+
+    Every ceremony start inserts a challenge row, so without a sweep the table
+    only ever grows and finish-path lookups walk an ever larger index.
+    """
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            async with session_factory() as db:
+                await cleanup_expired_challenges(db)
+        except Exception:  # noqa: BLE001
+            logger.exception("expired WebAuthn challenge cleanup failed")
+
+
 def create_app(settings: Settings | None = None) -> FastAPI:
     """Create and configure a FastAPI application with auth, DB, and (optionally) observability."""
     if settings is None:
@@ -39,8 +90,7 @@ def create_app(settings: Settings | None = None) -> FastAPI:
 
     async_session_factory = async_sessionmaker(async_engine, expire_on_commit=False)
 
-    @asynccontextmanager
-    async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
+    async def prepare_schema() -> None:
         if settings.auto_upgrade:
             if settings.env == "production":
                 logger.warning(
@@ -56,16 +106,51 @@ def create_app(settings: Settings | None = None) -> FastAPI:
                 logger.exception("database auto-upgrade failed")
                 raise
 
+        at_head = False
         try:
-            schema_status = await asyncio.to_thread(get_schema_status, settings.database_url)
+            schema_status = await get_schema_status_async(async_engine)
             if schema_status.warning:
                 logger.warning(schema_status.warning)
+            at_head = schema_status.state == "at_head"
         except PackagedMigrationsError:
             logger.warning("packaged migrations not found; installation may be broken")
 
-        async with async_engine.begin() as conn:
-            await conn.run_sync(Base.metadata.create_all)
+        # A database at migration head already has every h4ckath0n table, so the
+        # per-table existence checks of create_all are only needed when the app
+        # registered tables of its own on Base (or the schema is not migrated).
+        if not at_head or not _only_packaged_tables():
+            async with async_engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
+        # Pool prewarm only opens connections, so it overlaps with the migration
+        # and schema checks instead of adding its round trips after them.
+        prewarm: asyncio.Task[None] | None = None
+        if async_engine.dialect.name == "postgresql":
+            prewarm = asyncio.create_task(
+                prewarm_async_pool(async_engine, _POOL_PREWARM_CONNECTIONS)
+            )
+        try:
+            await prepare_schema()
+        except BaseException:
+            if prewarm is not None:
+                prewarm.cancel()
+            raise
+        if prewarm is not None:
+            await prewarm
+        sweeper: asyncio.Task[None] | None = None
+        if settings.webauthn_cleanup_interval_seconds > 0:
+            sweeper = asyncio.create_task(
+                _sweep_expired_challenges(
+                    async_session_factory, settings.webauthn_cleanup_interval_seconds
+                )
+            )
         yield
+        if sweeper is not None:
+            sweeper.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await sweeper
         await async_engine.dispose()
 
     app = FastAPI(
@@ -95,20 +180,14 @@ def create_app(settings: Settings | None = None) -> FastAPI:
             pass  # argon2-cffi not installed
 
     # --- default routes ---
-    class RootResponse(BaseModel):
-        message: str = Field(..., description="Welcome message.")
-
-    class HealthResponse(BaseModel):
-        status: str = Field(..., description="Health status string.")
-
     @app.get(
         "/",
         response_model=RootResponse,
         summary="Welcome",
         description="Default root route provided by h4ckath0n.",
     )
-    def root() -> RootResponse:
-        return RootResponse(message="Welcome to your h4ckath0n app!")
+    async def root() -> Response:
+        return Response(content=_ROOT_BODY, media_type="application/json")
 
     @app.get(
         "/health",
@@ -116,7 +195,7 @@ def create_app(settings: Settings | None = None) -> FastAPI:
         summary="Health",
         description="Basic health check for the app.",
     )
-    def health() -> HealthResponse:
-        return HealthResponse(status="healthy")
+    async def health() -> Response:
+        return Response(content=_HEALTH_BODY, media_type="application/json")
 
     return app
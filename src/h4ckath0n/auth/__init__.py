@@ -1,5 +1,20 @@
 """Authentication & authorisation helpers."""
 
-from h4ckath0n.auth.dependencies import require_admin, require_scopes, require_user
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from h4ckath0n.auth.dependencies import require_admin, require_scopes, require_user
 
 __all__ = ["require_admin", "require_scopes", "require_user"]
+
+
+def __getattr__(name: str) -> Any:
+    # Loaded lazily so importing h4ckath0n.auth.models (e.g. from the admin
+    # CLI) does not import FastAPI and the device-JWT verifier.
+    if name in __all__:
+        from h4ckath0n.auth import dependencies
+
+        return getattr(dependencies, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
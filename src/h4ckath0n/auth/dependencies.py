@@ -10,17 +10,32 @@ that HTTP, WebSocket and SSE endpoints all share a single code path.
 
 from __future__ import annotations
 
+from collections.abc import AsyncGenerator
 from typing import Any
 
 from fastapi import Depends, HTTPException, Request, status
-from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from sqlalchemy import select
+from fastapi.security import HTTPBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from h4ckath0n.auth.models import User
-from h4ckath0n.realtime.auth import AUD_HTTP, AuthContext, AuthError, verify_device_jwt
+from h4ckath0n.realtime.auth import AUD_HTTP, AuthError, _verify_device_jwt
 
-_bearer = HTTPBearer(
+
+class _BearerToken(HTTPBearer):
+    """``HTTPBearer`` that yields the raw token string.
+
+    FastAPI still documents it as the ``DeviceJWT`` security scheme, but no
+    ``HTTPAuthorizationCredentials`` model is built per request.
+    """
+
+    async def __call__(self, request: Request) -> str:  # type: ignore[override]
+        scheme, _, token = request.headers.get("Authorization", "").partition(" ")
+        if scheme.lower() != "bearer" or not token:
+            raise self.make_not_authenticated_error()
+        return token
+
+
+_bearer = _BearerToken(
     scheme_name="DeviceJWT",
     description=(
         "Device-signed ES256 JWT minted by the client. The JWT header must include "
@@ -29,70 +44,70 @@ _bearer = HTTPBearer(
 )
 
 
-async def _get_async_db_from_request(request: Request) -> AsyncSession:
-    return request.app.state.async_session_factory()  # type: ignore[no-any-return]
+async def _get_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """Yield the request's database session.
 
+    FastAPI caches dependency results per request, so the auth dependencies
+    and the route handler all share this one session (and pooled connection).
+    """
+    async with request.app.state.async_session_factory() as db:
+        yield db
 
-async def _get_auth_context(
-    request: Request,
-    credentials: HTTPAuthorizationCredentials = Depends(_bearer),
-) -> AuthContext:
-    token = credentials.credentials
-    db: AsyncSession = await _get_async_db_from_request(request)
+
+async def _get_current_user(
+    token: str = Depends(_bearer),
+    db: AsyncSession = Depends(_get_db),
+) -> User:
     try:
-        return await verify_device_jwt(token, expected_aud=AUD_HTTP, db=db)
+        _ctx, user = await _verify_device_jwt(token, expected_aud=AUD_HTTP, db=db)
     except AuthError as exc:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail=exc.detail,
         ) from None
-    finally:
-        await db.close()
+    return user
 
 
-async def _get_current_user(
-    request: Request,
-    ctx: AuthContext = Depends(_get_auth_context),
-) -> User:
-    db: AsyncSession = await _get_async_db_from_request(request)
-    try:
-        result = await db.execute(select(User).filter(User.id == ctx.user_id))
-        if (user := result.scalars().first()) is None:
-            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
-        return user
-    finally:
-        await db.close()
+async def _get_current_admin(user: User = Depends(_get_current_user)) -> User:
+    if user.role != "admin":
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Admin required")
+    return user
+
+
+# ``Depends`` markers are built once and shared by every route that uses them.
+_user_dep: Any = Depends(_get_current_user)
+_admin_dep: Any = Depends(_get_current_admin)
+_scopes_deps: dict[tuple[str, ...], Any] = {}
 
 
 def require_user() -> Any:
     """Dependency that returns the current authenticated user."""
-    return Depends(_get_current_user)
+    return _user_dep
 
 
 def require_admin() -> Any:
     """Dependency that requires the current user to be an admin."""
-
-    async def _admin(user: User = Depends(_get_current_user)) -> User:
-        if user.role != "admin":
-            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Admin required")
-        return user
-
-    return Depends(_admin)
+    return _admin_dep
 
 
 def require_scopes(*scopes: str) -> Any:
     """Dependency that requires the user to have specific scopes (from DB)."""
+    if (dep := _scopes_deps.get(scopes)) is not None:
+        return dep
 
-    needed: list[str] = list(scopes)
+    needed = frozenset(scopes)
 
     async def _scoped(user: User = Depends(_get_current_user)) -> User:
-        user_scopes = [s for s in user.scopes.split(",") if s]
-        for s in needed:
-            if s not in user_scopes:
-                raise HTTPException(
-                    status_code=status.HTTP_403_FORBIDDEN,
-                    detail=f"Missing scope: {s}",
-                )
-        return user
-
-    return Depends(_scoped)
+        user_scopes = set(user.scopes.split(","))
+        user_scopes.discard("")
+        if needed <= user_scopes:
+            return user
+        # Report the first missing scope in declaration order.
+        missing = next(s for s in scopes if s not in user_scopes)
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=f"Missing scope: {missing}",
+        )
+
+    dep = _scopes_deps[scopes] = Depends(_scoped)
+    return dep
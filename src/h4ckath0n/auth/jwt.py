@@ -2,46 +2,110 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+import warnings
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
 
 import jwt
-from pydantic import BaseModel
+from cryptography.hazmat.primitives.asymmetric.ec import EllipticCurvePublicKey
 
+# Allowed clock skew between the client that mints a token and this server.
+LEEWAY = timedelta(seconds=30)
 
-class JWTClaims(BaseModel):
+
+@dataclass(frozen=True, slots=True)
+class JWTClaims:
     """Typed representation of device-signed JWT payload.
 
     Contains only identity and time claims.  No privilege claims (role/scopes)
-    are read from the JWT – authorization is computed server-side.
+    are read from the JWT – authorization is computed server-side.  The time
+    claims are stored as the epoch seconds PyJWT validated (``iat_epoch`` /
+    ``exp_epoch``); ``iat`` and ``exp`` return them as aware UTC datetimes.
     """
 
     sub: str
-    iat: datetime
-    exp: datetime
+    iat_epoch: int
+    exp_epoch: int
     aud: str | None = None
     iss: str | None = None
 
+    @property
+    def iat(self) -> datetime:
+        return datetime.fromtimestamp(self.iat_epoch, UTC)
+
+    @property
+    def exp(self) -> datetime:
+        return datetime.fromtimestamp(self.exp_epoch, UTC)
+
+
+def _optional_str(payload: dict[str, object], claim: str) -> str | None:
+    value = payload.get(claim)
+    if value is not None and not isinstance(value, str):
+        raise jwt.InvalidTokenError(f"Invalid {claim} claim")
+    return value
+
 
 def decode_device_token(
     token: str,
     *,
-    public_key_pem: str,
+    public_key: EllipticCurvePublicKey | str | None = None,
+    public_key_pem: str | None = None,
 ) -> JWTClaims:
-    """Decode an ES256 device-signed JWT using the device's public key."""
+    """Decode an ES256 device-signed JWT using the device's public key (object or PEM).
+
+    ``public_key_pem`` is the previous name of ``public_key`` and is deprecated.
+    """
+    if public_key_pem is not None:
+        if public_key is not None:
+            raise TypeError("Pass either public_key or public_key_pem, not both")
+        warnings.warn(
+            "decode_device_token(public_key_pem=...) is deprecated; use public_key=",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        public_key = public_key_pem
+    if public_key is None:
+        raise TypeError("decode_device_token() missing required keyword argument: 'public_key'")
     payload = jwt.decode(
         token,
-        public_key_pem,
+        public_key,
         algorithms=["ES256"],
-        options={"verify_aud": False},
-        leeway=timedelta(seconds=30),  # allow some clock skew
+        options={"verify_aud": False, "require": ["sub", "iat", "exp"]},
+        leeway=LEEWAY,
+    )
+    # PyJWT has already checked presence and the numeric time claims, so only
+    # the string claims need a type check before building the claims object.
+    sub = payload["sub"]
+    if not isinstance(sub, str):
+        raise jwt.InvalidTokenError("Invalid sub claim")
+    return JWTClaims(
+        sub=sub,
+        iat_epoch=int(payload["iat"]),
+        exp_epoch=int(payload["exp"]),
+        aud=_optional_str(payload, "aud"),
+        iss=_optional_str(payload, "iss"),
     )
-    return JWTClaims(**payload)
 
 
 def get_unverified_kid(token: str) -> str | None:
-    """Extract the kid from the JWT header without verification."""
+    """Extract the kid from the JWT header without verification.
+
+    Public helper for callers that only need the header; the request auth path
+    uses :func:`get_unverified_identity`, which also reads ``sub``.
+    """
     try:
         header = jwt.get_unverified_header(token)
         return header.get("kid")
     except jwt.InvalidTokenError:
         return None
+
+
+def get_unverified_identity(token: str) -> tuple[str | None, str | None]:
+    """Extract ``(kid, sub)`` from the JWT without verification, in one parse."""
+    try:
+        decoded = jwt.decode_complete(token, options={"verify_signature": False})
+    except jwt.InvalidTokenError:
+        return None, None
+    kid = decoded["header"].get("kid")
+    sub = decoded["payload"].get("sub")
+    return kid, sub if isinstance(sub, str) else None
@@ -9,13 +9,20 @@ from __future__ import annotations
 
 from datetime import UTC, datetime
 
-from sqlalchemy import Boolean, DateTime, Index, LargeBinary, String, Text
+from sqlalchemy import Boolean, DateTime, Index, LargeBinary, String, Text, func, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from h4ckath0n.auth.passkeys.ids import new_device_id, new_key_id, new_token_id, new_user_id
 from h4ckath0n.db.base import Base
 
+# IDs are lowercase ASCII, so on Postgres the "C" collation gives byte-wise
+# comparisons in every ID index and join without changing any ordering.
+_ID = String(32).with_variant(String(32, collation="C"), "postgresql")
 
+
+# created_at is filled in Python so tables built by older create_all calls,
+# which have no DEFAULT on the column, keep working; the server default covers
+# rows inserted outside the ORM.
 def _utcnow() -> datetime:
     return datetime.now(UTC)
 
@@ -28,10 +35,12 @@ def _utcnow() -> datetime:
 class User(Base):
     __tablename__ = "h4ckath0n_users"
 
-    id: Mapped[str] = mapped_column(String(32), primary_key=True, default=new_user_id)
+    id: Mapped[str] = mapped_column(_ID, primary_key=True, default=new_user_id)
     role: Mapped[str] = mapped_column(String(20), nullable=False, default="user")
     scopes: Mapped[str] = mapped_column(Text, nullable=False, default="")
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=_utcnow)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=_utcnow, server_default=func.now()
+    )
     disabled_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
 
     # Optional password fields (only when password extra enabled)
@@ -49,18 +58,32 @@ class User(Base):
 class WebAuthnCredential(Base):
     __tablename__ = "h4ckath0n_webauthn_credentials"
 
-    id: Mapped[str] = mapped_column(String(32), primary_key=True, default=new_key_id)
-    user_id: Mapped[str] = mapped_column(String(32), nullable=False, index=True)
+    id: Mapped[str] = mapped_column(_ID, primary_key=True, default=new_key_id)
+    user_id: Mapped[str] = mapped_column(_ID, nullable=False, index=True)
     credential_id: Mapped[str] = mapped_column(Text, nullable=False, unique=True)
     public_key: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
     sign_count: Mapped[int] = mapped_column(nullable=False, default=0)
     aaguid: Mapped[str | None] = mapped_column(String(36), nullable=True)
     transports: Mapped[str | None] = mapped_column(Text, nullable=True)  # JSON array
     name: Mapped[str | None] = mapped_column(String(64), nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=_utcnow)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=_utcnow, server_default=func.now()
+    )
     last_used_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     revoked_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
 
+    __table_args__ = (
+        # list_passkeys: filter by user, ordered by creation.
+        Index("ix_h4ckath0n_webauthn_credentials_user_id_created_at", "user_id", "created_at"),
+        # Last-active-passkey count only ever looks at unrevoked rows.
+        Index(
+            "ix_h4ckath0n_webauthn_credentials_user_id_active",
+            "user_id",
+            postgresql_where=text("revoked_at IS NULL"),
+            sqlite_where=text("revoked_at IS NULL"),
+        ),
+    )
+
 
 # ---------------------------------------------------------------------------
 # WebAuthnChallenge  (ceremony state store)
@@ -72,11 +95,13 @@ class WebAuthnChallenge(Base):
 
     id: Mapped[str] = mapped_column(String(64), primary_key=True)
     challenge: Mapped[str] = mapped_column(Text, nullable=False)  # base64url-encoded
-    user_id: Mapped[str | None] = mapped_column(String(32), nullable=True)
+    user_id: Mapped[str | None] = mapped_column(_ID, nullable=True)
     kind: Mapped[str] = mapped_column(
         String(20), nullable=False
     )  # "register" | "authenticate" | "add_credential"
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=_utcnow)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=_utcnow, server_default=func.now()
+    )
     expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
     consumed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     rp_id: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -93,12 +118,14 @@ class WebAuthnChallenge(Base):
 class PasswordResetToken(Base):
     __tablename__ = "h4ckath0n_password_reset_tokens"
 
-    id: Mapped[str] = mapped_column(String(32), primary_key=True, default=new_token_id)
-    user_id: Mapped[str] = mapped_column(String(32), nullable=False, index=True)
+    id: Mapped[str] = mapped_column(_ID, primary_key=True, default=new_token_id)
+    user_id: Mapped[str] = mapped_column(_ID, nullable=False, index=True)
     token_hash: Mapped[str] = mapped_column(Text, nullable=False, unique=True)
     expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
     used: Mapped[bool] = mapped_column(Boolean, default=False)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=_utcnow)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=_utcnow, server_default=func.now()
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -109,12 +136,24 @@ class PasswordResetToken(Base):
 class Device(Base):
     __tablename__ = "h4ckath0n_devices"
 
-    id: Mapped[str] = mapped_column(String(32), primary_key=True, default=new_device_id)
-    user_id: Mapped[str] = mapped_column(String(32), nullable=False, index=True)
+    id: Mapped[str] = mapped_column(_ID, primary_key=True, default=new_device_id)
+    user_id: Mapped[str] = mapped_column(_ID, nullable=False, index=True)
     public_key_jwk: Mapped[str] = mapped_column(Text, nullable=False)  # JSON-serialized JWK
     fingerprint: Mapped[str | None] = mapped_column(
         String(64), unique=True, nullable=True, index=True
     )  # SHA-256 hex of canonical JWK
     label: Mapped[str | None] = mapped_column(String(255), nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=_utcnow)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=_utcnow, server_default=func.now()
+    )
     revoked_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        # Active-device listings and counts per user skip revoked rows.
+        Index(
+            "ix_h4ckath0n_devices_user_id_active",
+            "user_id",
+            postgresql_where=text("revoked_at IS NULL"),
+            sqlite_where=text("revoked_at IS NULL"),
+        ),
+    )
@@ -10,133 +10,78 @@ Scheme
 
 Implementation notes
 --------------------
-* Per-thread XOF reader using cryptography's XOFHash(SHAKE128).
-* A process-wide master key is generated from os.urandom(32) at import/startup.
-* Stream input is domain-separated and bound to (master_key, tid, per-reader OS randomness).
-* Fork safety: clear thread-local cached reader in the child via os.register_at_fork so the
-  child never reuses an inherited XOF state. If the fork hook cannot be installed, we fall
-  back to PID checking and emit a warning on platforms that support fork.
+* Randomness comes from os.urandom, drawn in 20 KiB batches into a per-thread
+  buffer and handed out in slices, so an ID costs a slice instead of a syscall.
+* Fork safety: the buffer is cleared in the child via os.register_at_fork, so a
+  forked worker never hands out bytes its parent already used or will use.
 """
 
 from __future__ import annotations
 
 import base64
-import contextlib
 import os
-import sys
+import re
 import threading
-import warnings
 
-from cryptography.hazmat.primitives import hashes
+_B32_ALPHABET = "abcdefghijklmnopqrstuvwxyz234567"
 
-_ID_LEN = 32
-_ALLOWED_CHARS = set("abcdefghijklmnopqrstuvwxyz234567")
+# One compiled matcher per prefix; fullmatch also pins the length to 32 chars.
+# Without re.IGNORECASE, [a-z] only matches ASCII lowercase letters.
+_USER_ID_MATCH = re.compile(r"u[a-z2-7]{31}").fullmatch
+_KEY_ID_MATCH = re.compile(r"k[a-z2-7]{31}").fullmatch
+_DEVICE_ID_MATCH = re.compile(r"d[a-z2-7]{31}").fullmatch
 
-# Domain separation for this particular PRNG stream.
-_DOMAIN = b"h4ckath0n:idgen:v1\x00"
+# Every 10-bit value mapped to its two lowercase base32 characters, so a 20-byte
+# ID encodes in 16 lookups without an uppercase-then-lower pass.
+_B32_PAIRS = tuple(a + b for a in _B32_ALPHABET for b in _B32_ALPHABET)
+_ID_SHIFTS = tuple(range(150, -1, -10))
+_BODY_SHIFTS = _ID_SHIFTS[1:]
 
-# No env override, always generate from OS at startup/import time.
-_MASTER_KEY = os.urandom(32)
-
-_U64_MASK = (1 << 64) - 1
-
-
-def _u64le(x: int) -> bytes:
-    # threading.get_ident() and os.getpid() are expected to be non-negative in practice.
-    # Mask defensively so we never raise OverflowError for unusually large values.
-    return (x & _U64_MASK).to_bytes(8, "little", signed=False)
-
-
-class _ShakeXOFReader:
-    __slots__ = ("_xof",)
-
-    def __init__(self, tid: int) -> None:
-        alg = hashes.SHAKE128(digest_size=sys.maxsize)
-        xof = hashes.XOFHash(alg)
-
-        # Bind this per-thread stream to: domain || master_key || tid || randombytes(16)
-        xof.update(_DOMAIN)
-        xof.update(_MASTER_KEY)
-        xof.update(_u64le(tid))
-        xof.update(os.urandom(16))  # Extra per-reader randomness from the OS.
-
-        self._xof = xof
-
-    def read(self, nbytes: int) -> bytes:
-        if nbytes < 0:
-            raise ValueError("nbytes must be >= 0")
-        return self._xof.squeeze(nbytes)
+# Enough for 1024 IDs per urandom call.
+_POOL_SIZE = 20 * 1024
 
 
 class _TLS(threading.local):
     # Typed thread-local slots for mypy (avoids Any from getattr on threading.local).
-    reader: _ShakeXOFReader | None
-    pid: int | None
+    pool: bytes
+    pool_off: int
 
     def __init__(self) -> None:
-        self.reader = None
-        self.pid = None
+        self.pool = b""
+        self.pool_off = 0
 
 
 _tls = _TLS()
 
 
 def _clear_tls_after_fork_child() -> None:
-    # After fork, the child inherits thread-local objects and their internal XOF state.
-    # Clearing forces a rebuild and immediate divergence in the child.
-    with contextlib.suppress(Exception):
-        _tls.reader = None
-        _tls.pid = None
+    # The child inherits the parent's buffered bytes; drop them so parent and
+    # child never hand out the same bytes.
+    _tls.pool = b""
+    _tls.pool_off = 0
 
 
-_FORK_HOOK_INSTALLED = False
-try:
+if hasattr(os, "register_at_fork"):
     os.register_at_fork(after_in_child=_clear_tls_after_fork_child)
-    _FORK_HOOK_INSTALLED = True
-except AttributeError:
-    # register_at_fork is not available on this Python or platform.
-    _FORK_HOOK_INSTALLED = False
-except Exception:
-    # Best-effort, if registration fails we still keep a safe fallback below.
-    _FORK_HOOK_INSTALLED = False
-
-if not _FORK_HOOK_INSTALLED and hasattr(os, "fork"):
-    warnings.warn(
-        "Fork-safety hook (os.register_at_fork) is unavailable. This module will fall back to "
-        "PID checking to avoid reusing inherited XOF state after fork, which adds a small "
-        "per-call overhead. If you later remove the PID fallback and still fork, ID collisions "
-        "can occur because the child can inherit the parent's XOF stream state.",
-        RuntimeWarning,
-        stacklevel=2,
-    )
-
-
-def _thread_reader() -> _ShakeXOFReader:
-    reader = _tls.reader
-    if reader is not None:
-        if _FORK_HOOK_INSTALLED:
-            return reader
-        # Fallback safety if we could not install a fork hook: detect fork by PID change.
-        pid = os.getpid()
-        if _tls.pid == pid:
-            return reader
-
-    tid = threading.get_ident()
-    reader = _ShakeXOFReader(tid)
-    _tls.reader = reader
-    if not _FORK_HOOK_INSTALLED:
-        _tls.pid = os.getpid()
-    return reader
 
 
 def random_bytes(nbytes: int) -> bytes:
-    """Return *nbytes* random bytes from the per-thread XOF stream.
+    """Return *nbytes* random bytes from the per-thread os.urandom buffer.
 
     This is the shared primitive used by higher-level ID helpers.
     """
     if nbytes <= 0:
         raise ValueError("nbytes must be > 0")
-    return _thread_reader().read(nbytes)
+    if nbytes > _POOL_SIZE:
+        return os.urandom(nbytes)
+    tls = _tls
+    off = tls.pool_off
+    end = off + nbytes
+    if end > len(tls.pool):
+        tls.pool = os.urandom(_POOL_SIZE)
+        off, end = 0, nbytes
+    tls.pool_off = end
+    return tls.pool[off:end]
 
 
 def random_base32(nbytes: int = 20) -> str:
@@ -150,25 +95,40 @@ def random_base32(nbytes: int = 20) -> str:
     if nbytes % 5 != 0:
         raise ValueError("nbytes must be a multiple of 5 to avoid base32 padding")
     raw = random_bytes(nbytes)
+    if nbytes == 20:
+        n = int.from_bytes(raw, "big")
+        return "".join([_B32_PAIRS[(n >> shift) & 0x3FF] for shift in _ID_SHIFTS])
     return base64.b32encode(raw).decode("ascii").lower()
 
 
+def _new_prefixed(prefix: str) -> str:
+    # Same bits as random_base32(20) with the first character replaced by the
+    # prefix, built in one join: the top 10-bit group only contributes its low
+    # 5 bits, since its high 5 bits would have encoded the replaced character.
+    n = int.from_bytes(random_bytes(20), "big")
+    pairs = _B32_PAIRS
+    return "".join(
+        [
+            prefix,
+            _B32_ALPHABET[(n >> 150) & 0x1F],
+            *[pairs[(n >> shift) & 0x3FF] for shift in _BODY_SHIFTS],
+        ]
+    )
+
+
 def new_user_id() -> str:
     """Generate a user ID (32 chars, starts with 'u')."""
-    s = random_base32()
-    return "u" + s[1:]
+    return _new_prefixed("u")
 
 
 def new_key_id() -> str:
     """Generate a credential key ID (32 chars, starts with 'k')."""
-    s = random_base32()
-    return "k" + s[1:]
+    return _new_prefixed("k")
 
 
 def new_device_id() -> str:
     """Generate a device ID (32 chars, starts with 'd')."""
-    s = random_base32()
-    return "d" + s[1:]
+    return _new_prefixed("d")
 
 
 def new_token_id() -> str:
@@ -178,20 +138,14 @@ def new_token_id() -> str:
 
 def is_user_id(value: str) -> bool:
     """Return True when *value* looks like a valid user ID."""
-    return (
-        len(value) == _ID_LEN and value[:1] == "u" and all(c in _ALLOWED_CHARS for c in value[1:])
-    )
+    return _USER_ID_MATCH(value) is not None
 
 
 def is_key_id(value: str) -> bool:
     """Return True when *value* looks like a valid key ID."""
-    return (
-        len(value) == _ID_LEN and value[:1] == "k" and all(c in _ALLOWED_CHARS for c in value[1:])
-    )
+    return _KEY_ID_MATCH(value) is not None
 
 
 def is_device_id(value: str) -> bool:
     """Return True when *value* looks like a valid device ID."""
-    return (
-        len(value) == _ID_LEN and value[:1] == "d" and all(c in _ALLOWED_CHARS for c in value[1:])
-    )
+    return _DEVICE_ID_MATCH(value) is not None
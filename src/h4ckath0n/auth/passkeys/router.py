@@ -2,13 +2,11 @@
 
 from __future__ import annotations
 
-from collections.abc import AsyncGenerator
-
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from h4ckath0n.auth import schemas as auth_schemas
-from h4ckath0n.auth.dependencies import _get_current_user
+from h4ckath0n.auth.dependencies import _get_current_user, _get_db
 from h4ckath0n.auth.models import User
 from h4ckath0n.auth.passkeys import schemas
 from h4ckath0n.auth.passkeys.service import (
@@ -16,7 +14,7 @@ from h4ckath0n.auth.passkeys.service import (
     finish_add_credential,
     finish_authentication,
     finish_registration,
-    list_passkeys,
+    list_passkey_summaries,
     rename_passkey,
     revoke_passkey,
     start_add_credential,
@@ -27,15 +25,9 @@ from h4ckath0n.auth.service import register_device
 
 router = APIRouter(prefix="/auth/passkey", tags=["passkey"])
 
-
-# ---------------------------------------------------------------------------
-# DB dependency (async)
-# ---------------------------------------------------------------------------
-
-
-async def _db_dep(request: Request) -> AsyncGenerator[AsyncSession, None]:
-    async with request.app.state.async_session_factory() as db:
-        yield db
+# Response bodies below are built with model_construct: every value is
+# server-generated or read from typed ORM columns, so validating it again on
+# construction is wasted work.
 
 
 # ---------------------------------------------------------------------------
@@ -58,10 +50,10 @@ async def _db_dep(request: Request) -> AsyncGenerator[AsyncSession, None]:
         }
     },
 )
-async def register_start(request: Request, db: AsyncSession = Depends(_db_dep)):
+async def register_start(request: Request, db: AsyncSession = Depends(_get_db)):
     settings = request.app.state.settings
     flow_id, options = await start_registration(db, settings)
-    return schemas.PasskeyRegisterStartResponse(flow_id=flow_id, options=options)
+    return schemas.PasskeyRegisterStartResponse.model_construct(flow_id=flow_id, options=options)
 
 
 @router.post(
@@ -83,7 +75,7 @@ async def register_start(request: Request, db: AsyncSession = Depends(_db_dep)):
 async def register_finish(
     body: schemas.PasskeyRegisterFinishRequest,
     request: Request,
-    db: AsyncSession = Depends(_db_dep),
+    db: AsyncSession = Depends(_get_db),
 ):
     settings = request.app.state.settings
     try:
@@ -93,7 +85,9 @@ async def register_finish(
 
     device_id = await register_device(db, user.id, body.device_public_key_jwk, body.device_label)
 
-    return schemas.PasskeyFinishResponse(user_id=user.id, device_id=device_id, role=user.role)
+    return schemas.PasskeyFinishResponse.model_construct(
+        user_id=user.id, device_id=device_id, role=user.role
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -109,10 +103,10 @@ async def register_finish(
         "Begin a username-less passkey login ceremony and return WebAuthn authentication options."
     ),
 )
-async def login_start(request: Request, db: AsyncSession = Depends(_db_dep)):
+async def login_start(request: Request, db: AsyncSession = Depends(_get_db)):
     settings = request.app.state.settings
     flow_id, options = await start_authentication(db, settings)
-    return schemas.PasskeyLoginStartResponse(flow_id=flow_id, options=options)
+    return schemas.PasskeyLoginStartResponse.model_construct(flow_id=flow_id, options=options)
 
 
 @router.post(
@@ -133,7 +127,7 @@ async def login_start(request: Request, db: AsyncSession = Depends(_db_dep)):
 async def login_finish(
     body: schemas.PasskeyLoginFinishRequest,
     request: Request,
-    db: AsyncSession = Depends(_db_dep),
+    db: AsyncSession = Depends(_get_db),
 ):
     settings = request.app.state.settings
     try:
@@ -143,7 +137,9 @@ async def login_finish(
 
     device_id = await register_device(db, user.id, body.device_public_key_jwk, body.device_label)
 
-    return schemas.PasskeyFinishResponse(user_id=user.id, device_id=device_id, role=user.role)
+    return schemas.PasskeyFinishResponse.model_construct(
+        user_id=user.id, device_id=device_id, role=user.role
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -165,11 +161,11 @@ async def login_finish(
 async def add_start(
     request: Request,
     user: User = Depends(_get_current_user),
-    db: AsyncSession = Depends(_db_dep),
+    db: AsyncSession = Depends(_get_db),
 ):
     settings = request.app.state.settings
     flow_id, options = await start_add_credential(db, user, settings)
-    return schemas.PasskeyAddStartResponse(flow_id=flow_id, options=options)
+    return schemas.PasskeyAddStartResponse.model_construct(flow_id=flow_id, options=options)
 
 
 @router.post(
@@ -190,7 +186,7 @@ async def add_finish(
     body: schemas.PasskeyAddFinishRequest,
     request: Request,
     user: User = Depends(_get_current_user),
-    db: AsyncSession = Depends(_db_dep),
+    db: AsyncSession = Depends(_get_db),
 ):
     settings = request.app.state.settings
     try:
@@ -200,7 +196,9 @@ async def add_finish(
 
     device_id = await register_device(db, user.id, body.device_public_key_jwk, body.device_label)
 
-    return schemas.PasskeyFinishResponse(user_id=user.id, device_id=device_id, role=user.role)
+    return schemas.PasskeyFinishResponse.model_construct(
+        user_id=user.id, device_id=device_id, role=user.role
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -209,6 +207,19 @@ async def add_finish(
 
 passkeys_router = APIRouter(prefix="/auth/passkeys", tags=["passkey"])
 
+# Revoke outcomes never vary, so build them once; the route's response_model
+# still documents the schema in OpenAPI.
+_REVOKE_OK_BODY = (
+    schemas.PasskeyRevokeResponse(message="Passkey revoked").model_dump_json().encode()
+)
+_LAST_PASSKEY_DETAIL = schemas.PasskeyRevokeError(
+    code="LAST_PASSKEY",
+    message=(
+        "Cannot revoke the last active passkey. Add another passkey via "
+        "POST /auth/passkey/add/start first."
+    ),
+).model_dump()
+
 
 @passkeys_router.get(
     "",
@@ -222,20 +233,20 @@ passkeys_router = APIRouter(prefix="/auth/passkeys", tags=["passkey"])
 async def passkeys_list(
     request: Request,
     user: User = Depends(_get_current_user),
-    db: AsyncSession = Depends(_db_dep),
+    db: AsyncSession = Depends(_get_db),
 ):
-    creds = await list_passkeys(db, user)
+    rows = await list_passkey_summaries(db, user)
     items = [
-        schemas.PasskeyInfo(
-            id=c.id,
-            name=c.name,
-            created_at=c.created_at,
-            last_used_at=c.last_used_at,
-            revoked_at=c.revoked_at,
+        schemas.PasskeyInfo.model_construct(
+            id=key_id,
+            name=name,
+            created_at=created_at,
+            last_used_at=last_used_at,
+            revoked_at=revoked_at,
         )
-        for c in creds
+        for key_id, name, created_at, last_used_at, revoked_at in rows
     ]
-    return schemas.PasskeyListResponse(passkeys=items)
+    return schemas.PasskeyListResponse.model_construct(passkeys=items)
 
 
 @passkeys_router.post(
@@ -269,24 +280,17 @@ async def passkey_revoke(
     key_id: str,
     request: Request,
     user: User = Depends(_get_current_user),
-    db: AsyncSession = Depends(_db_dep),
+    db: AsyncSession = Depends(_get_db),
 ):
     try:
         await revoke_passkey(db, user, key_id)
     except LastPasskeyError:
         raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail=schemas.PasskeyRevokeError(
-                code="LAST_PASSKEY",
-                message=(
-                    "Cannot revoke the last active passkey. Add another passkey via "
-                    "POST /auth/passkey/add/start first."
-                ),
-            ).model_dump(),
+            status_code=status.HTTP_409_CONFLICT, detail=_LAST_PASSKEY_DETAIL
         ) from None
     except ValueError as exc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from None
-    return schemas.PasskeyRevokeResponse(message="Passkey revoked")
+    return Response(content=_REVOKE_OK_BODY, media_type="application/json")
 
 
 @passkeys_router.patch(
@@ -309,7 +313,7 @@ async def passkey_rename(
     body: schemas.PasskeyRenameRequest,
     request: Request,
     user: User = Depends(_get_current_user),
-    db: AsyncSession = Depends(_db_dep),
+    db: AsyncSession = Depends(_get_db),
 ):
     try:
         cred = await rename_passkey(db, user, key_id, body.name)
@@ -317,4 +321,4 @@ async def passkey_rename(
         if "revoked" in (msg := str(exc)).lower():
             raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=msg) from None
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=msg) from None
-    return schemas.PasskeyRenameResponse(id=cred.id, name=cred.name)
+    return schemas.PasskeyRenameResponse.model_construct(id=cred.id, name=cred.name)
@@ -4,13 +4,15 @@ from __future__ import annotations
 
 import json
 import secrets
+from collections.abc import Sequence
 from datetime import UTC, datetime, timedelta
 
-from sqlalchemy import func, select
+from sqlalchemy import Row, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
 from h4ckath0n.auth.models import User, WebAuthnChallenge, WebAuthnCredential
-from h4ckath0n.auth.passkeys.ids import new_key_id
+from h4ckath0n.auth.passkeys.ids import new_key_id, new_user_id
 from h4ckath0n.auth.passkeys.webauthn import (
     base64url_to_bytes,
     bytes_to_base64url,
@@ -74,9 +76,10 @@ async def start_registration(
     rp_id = settings.effective_rp_id()
     origin = settings.effective_origin()
 
-    user = User()
+    # The ID is minted here rather than by the column default, so the user and
+    # its flow go out together in the single flush at commit.
+    user = User(id=new_user_id())
     db.add(user)
-    await db.flush()
 
     challenge_bytes = _new_challenge()
     flow_id = _new_flow_id()
@@ -187,14 +190,19 @@ async def finish_authentication(
     flow = await _get_valid_flow(db, flow_id, "authenticate")
 
     raw_id = credential_json.get("rawId") or credential_json.get("id", "")
+    # Load the owning user alongside the credential so a successful login costs
+    # one SELECT instead of a second lookup after the commit.
     result = await db.execute(
-        select(WebAuthnCredential).filter(
+        select(WebAuthnCredential, User)
+        .outerjoin(User, User.id == WebAuthnCredential.user_id)
+        .filter(
             WebAuthnCredential.credential_id == raw_id,
             WebAuthnCredential.revoked_at.is_(None),
         )
     )
-    if (stored := result.scalars().first()) is None:
+    if (row := result.first()) is None:
         raise ValueError("Unknown or revoked credential")
+    stored, user = row
 
     challenge_bytes = base64url_to_bytes(flow.challenge)
     _cred_id, new_sign_count = verify_authentication(
@@ -206,14 +214,15 @@ async def finish_authentication(
         credential_current_sign_count=stored.sign_count,
     )
 
+    # The counter update is committed together with the consumed challenge so
+    # a cloned authenticator cannot replay an older counter in the meantime.
     await _consume_flow(db, flow)
 
     stored.sign_count = new_sign_count
     stored.last_used_at = datetime.now(UTC)
     await db.commit()
 
-    user_result = await db.execute(select(User).filter(User.id == stored.user_id))
-    if (user := user_result.scalars().first()) is None:
+    if user is None:
         raise ValueError("User not found")
     return user
 
@@ -326,6 +335,28 @@ async def list_passkeys(db: AsyncSession, user: User) -> list[WebAuthnCredential
     return list(result.scalars().all())
 
 
+async def list_passkey_summaries(
+    db: AsyncSession, user: User
+) -> Sequence[Row[str, str | None, datetime, datetime | None, datetime | None]]:
+    """Return ``(id, name, created_at, last_used_at, revoked_at)`` rows for a user's passkeys.
+
+    Same rows and order as :func:`list_passkeys`, but only the listed columns are
+    fetched and no ORM objects are built.
+    """
+    result = await db.execute(
+        select(
+            WebAuthnCredential.id,
+            WebAuthnCredential.name,
+            WebAuthnCredential.created_at,
+            WebAuthnCredential.last_used_at,
+            WebAuthnCredential.revoked_at,
+        )
+        .filter(WebAuthnCredential.user_id == user.id)
+        .order_by(WebAuthnCredential.created_at)
+    )
+    return result.all()
+
+
 async def rename_passkey(
     db: AsyncSession, user: User, key_id: str, name: str | None
 ) -> WebAuthnCredential:
@@ -370,27 +401,29 @@ async def revoke_passkey(db: AsyncSession, user: User, key_id: str) -> None:
         # Per-user mutex. In SQLite, FOR UPDATE is ignored (acceptable for dev/tests).
         await db.execute(select(User.id).filter(User.id == user.id).with_for_update())
 
+        # The active-passkey count rides along as a scalar subquery, so the
+        # credential and the count come back in one round trip.  No FOR UPDATE
+        # here: the User row lock above is the mutex.
+        active = aliased(WebAuthnCredential)
+        active_count = (
+            select(func.count())
+            .select_from(active)
+            .filter(active.user_id == user.id, active.revoked_at.is_(None))
+            .scalar_subquery()
+        )
         result = await db.execute(
-            select(WebAuthnCredential).filter(
+            select(WebAuthnCredential, active_count).filter(
                 WebAuthnCredential.id == key_id,
                 WebAuthnCredential.user_id == user.id,
             )
         )
-        if (cred := result.scalars().first()) is None:
+        if (row := result.first()) is None:
             raise ValueError("Credential not found")
+        cred, count = row
         if cred.revoked_at is not None:
             raise ValueError("Credential already revoked")
 
-        # Count active passkeys without FOR UPDATE (mutex is the User row lock above).
-        active_count = await db.scalar(
-            select(func.count())
-            .select_from(WebAuthnCredential)
-            .filter(
-                WebAuthnCredential.user_id == user.id,
-                WebAuthnCredential.revoked_at.is_(None),
-            )
-        )
-        if active_count is not None and int(active_count) <= 1:
+        if int(count) <= 1:
             raise LastPasskeyError(
                 "Cannot revoke the last active passkey. "
                 "Add another passkey via POST /auth/passkey/add/start first."
@@ -9,11 +9,11 @@ from typing import Any
 from webauthn import (
     generate_authentication_options,
     generate_registration_options,
-    options_to_json,
     verify_authentication_response,
     verify_registration_response,
 )
 from webauthn.helpers import (
+    options_to_json_dict,
     parse_authentication_credential_json,
     parse_registration_credential_json,
 )
@@ -75,8 +75,9 @@ def make_registration_options(
         ),
         exclude_credentials=exclude_credentials or [],
     )
-    result: dict[str, Any] = json.loads(options_to_json(opts))
-    return result
+    # options_to_json_dict gives the same JSON-safe dict as options_to_json
+    # without a dumps/loads round-trip; the response model serializes it once.
+    return options_to_json_dict(opts)
 
 
 def make_authentication_options(
@@ -94,8 +95,7 @@ def make_authentication_options(
         user_verification=_uv(settings),
         allow_credentials=allow_credentials or [],
     )
-    result: dict[str, Any] = json.loads(options_to_json(opts))
-    return result
+    return options_to_json_dict(opts)
 
 
 def verify_registration(
@@ -10,12 +10,11 @@ They do **not** return access/refresh tokens.
 
 from __future__ import annotations
 
-from collections.abc import AsyncGenerator
-
 from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from h4ckath0n.auth import schemas
+from h4ckath0n.auth.dependencies import _get_db
 from h4ckath0n.auth.service import (
     authenticate_user,
     confirm_password_reset,
@@ -27,11 +26,6 @@ from h4ckath0n.auth.service import (
 router = APIRouter(prefix="/auth", tags=["auth"])
 
 
-async def _db_dep(request: Request) -> AsyncGenerator[AsyncSession, None]:
-    async with request.app.state.async_session_factory() as db:
-        yield db
-
-
 # ---------------------------------------------------------------------------
 # Password-based routes (optional extra)
 # ---------------------------------------------------------------------------
@@ -57,7 +51,7 @@ def _password_router() -> APIRouter:
         },
     )
     async def register(
-        body: schemas.RegisterRequest, request: Request, db: AsyncSession = Depends(_db_dep)
+        body: schemas.RegisterRequest, request: Request, db: AsyncSession = Depends(_get_db)
     ):
         settings = request.app.state.settings
         try:
@@ -82,7 +76,7 @@ def _password_router() -> APIRouter:
         },
     )
     async def login(
-        body: schemas.LoginRequest, request: Request, db: AsyncSession = Depends(_db_dep)
+        body: schemas.LoginRequest, request: Request, db: AsyncSession = Depends(_get_db)
     ):
         if (user := await authenticate_user(db, body.email, body.password)) is None:
             raise HTTPException(
@@ -105,7 +99,7 @@ def _password_router() -> APIRouter:
     async def password_reset_request(
         body: schemas.PasswordResetRequestSchema,
         request: Request,
-        db: AsyncSession = Depends(_db_dep),
+        db: AsyncSession = Depends(_get_db),
     ):
         settings = request.app.state.settings
         await create_password_reset_token(
@@ -131,7 +125,7 @@ def _password_router() -> APIRouter:
     )
     async def password_reset_confirm(
         body: schemas.PasswordResetConfirmSchema,
-        db: AsyncSession = Depends(_db_dep),
+        db: AsyncSession = Depends(_get_db),
     ):
         try:
             user = await confirm_password_reset(db, body.token, body.new_password)
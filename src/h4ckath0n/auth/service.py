@@ -11,10 +11,11 @@ import json
 import secrets
 from datetime import UTC, datetime, timedelta
 
-from sqlalchemy import func, select
+from sqlalchemy import func, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from h4ckath0n.auth.models import Device, PasswordResetToken, User
+from h4ckath0n.auth.passkeys.ids import new_device_id
 from h4ckath0n.config import Settings
 
 
@@ -114,20 +115,23 @@ async def register_device(
         return ""
     fp = _jwk_fingerprint(public_key_jwk)
 
-    result = await db.execute(select(Device).filter(Device.fingerprint == fp))
-    if existing := result.scalars().first():
-        return existing.id
-
-    device = Device(
-        user_id=user_id,
-        public_key_jwk=json.dumps(public_key_jwk),
-        fingerprint=fp,
-        label=label,
+    if existing_id := await db.scalar(select(Device.id).filter(Device.fingerprint == fp)):
+        return existing_id
+
+    # Mint the ID here and insert with a Core statement: nothing reads the new
+    # row back, so the unit of work and its RETURNING of created_at are skipped.
+    device_id = new_device_id()
+    await db.execute(
+        insert(Device).values(
+            id=device_id,
+            user_id=user_id,
+            public_key_jwk=json.dumps(public_key_jwk),
+            fingerprint=fp,
+            label=label,
+        )
     )
-    db.add(device)
     await db.commit()
-    await db.refresh(device)
-    return device.id
+    return device_id
 
 
 async def create_password_reset_token(
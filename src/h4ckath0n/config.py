@@ -28,6 +28,7 @@ class Settings(BaseSettings):
     rp_id: str = ""
     origin: str = ""
     webauthn_ttl_seconds: int = 300
+    webauthn_cleanup_interval_seconds: int = 600  # 0 disables the expired-challenge sweep
     user_verification: str = "preferred"
     attestation: str = "none"
 
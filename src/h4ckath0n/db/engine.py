@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from sqlalchemy import Engine, create_engine
+import asyncio
+
+from sqlalchemy import Engine, create_engine, text
 from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 
 from h4ckath0n.config import Settings
@@ -44,3 +46,18 @@ def create_async_engine_from_settings(settings: Settings | None = None) -> Async
         kwargs["max_overflow"] = 20
         kwargs["pool_pre_ping"] = True
     return create_async_engine(url, **kwargs)
+
+
+async def prewarm_async_pool(engine: AsyncEngine, connections: int) -> None:
+    """Open *connections* pooled connections up front.
+
+    The connections are checked out concurrently so each one is a distinct
+    pooled connection; returning them leaves them idle in the pool, so the
+    first requests after startup skip the connect/TLS/auth handshake.
+    """
+
+    async def _ping() -> None:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    await asyncio.gather(*(_ping() for _ in range(connections)))
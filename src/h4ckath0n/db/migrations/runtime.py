@@ -6,13 +6,15 @@ import asyncio
 import importlib.resources
 from contextlib import contextmanager
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
 from alembic import command as alembic_command
 from alembic.config import Config
 from alembic.runtime.migration import MigrationContext
 from alembic.script import ScriptDirectory
-from sqlalchemy.engine import Engine, create_engine, make_url
+from sqlalchemy.engine import Connection, Engine, create_engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine
 
 # Must match env.py
 VERSION_TABLE = "h4ckath0n_alembic_version"
@@ -87,23 +89,49 @@ def _alembic_config(db_url: str, migrations_dir: Path) -> Config:
     return cfg
 
 
+@lru_cache(maxsize=1)
+def _packaged_head_revisions() -> tuple[str, ...]:
+    # The packaged migration scripts cannot change while the process runs, so
+    # parse them once rather than on every status check.
+    with packaged_migrations_dir() as migrations_dir:
+        script = ScriptDirectory.from_config(_alembic_config("", migrations_dir))
+        return tuple(sorted(script.get_heads()))
+
+
+def _current_revisions(conn: Connection) -> tuple[str, ...]:
+    migration_ctx = MigrationContext.configure(conn, opts={"version_table": VERSION_TABLE})
+    return tuple(sorted(migration_ctx.get_current_heads()))
+
+
 def get_schema_status(db_url: str) -> SchemaStatus:
     sync_url = normalize_db_url_for_sync(db_url)
-    with packaged_migrations_dir() as migrations_dir:
-        cfg = _alembic_config(sync_url, migrations_dir)
-        script = ScriptDirectory.from_config(cfg)
-        head_revisions = tuple(sorted(script.get_heads()))
+    head_revisions = _packaged_head_revisions()
 
     engine = create_sync_engine(sync_url)
     try:
         with engine.connect() as conn:
-            # Check for version table
-            migration_ctx = MigrationContext.configure(conn, opts={"version_table": VERSION_TABLE})
-            current_revisions = tuple(sorted(migration_ctx.get_current_heads()))
-
+            current_revisions = _current_revisions(conn)
     finally:
         engine.dispose()
 
+    return _schema_status(current_revisions, head_revisions)
+
+
+async def get_schema_status_async(engine: AsyncEngine) -> SchemaStatus:
+    """Check the schema over an existing async engine.
+
+    Used at app startup so the check reuses the app's own connection pool
+    instead of building (and handshaking) a throwaway sync engine.
+    """
+    head_revisions = _packaged_head_revisions()
+    async with engine.connect() as conn:
+        current_revisions = await conn.run_sync(_current_revisions)
+    return _schema_status(current_revisions, head_revisions)
+
+
+def _schema_status(
+    current_revisions: tuple[str, ...], head_revisions: tuple[str, ...]
+) -> SchemaStatus:
     if current_revisions and set(current_revisions) == set(head_revisions):
         return SchemaStatus(
             state="at_head",
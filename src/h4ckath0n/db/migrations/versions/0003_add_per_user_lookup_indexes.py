@@ -0,0 +1,58 @@
+"""add per-user lookup indexes on credentials and devices
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2025-01-03 00:00:00.000000
+
+Safe, additive migration:
+  - (user_id, created_at) on webauthn_credentials, matching list_passkeys.
+  - Partial (user_id) WHERE revoked_at IS NULL on webauthn_credentials and
+    devices, for active-row counts and listings.
+  - Downgrade drops the three indexes; no data is touched.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0003"
+down_revision: str | None = "0002"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_ACTIVE = sa.text("revoked_at IS NULL")
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_h4ckath0n_webauthn_credentials_user_id_created_at",
+        "h4ckath0n_webauthn_credentials",
+        ["user_id", "created_at"],
+    )
+    op.create_index(
+        "ix_h4ckath0n_webauthn_credentials_user_id_active",
+        "h4ckath0n_webauthn_credentials",
+        ["user_id"],
+        postgresql_where=_ACTIVE,
+        sqlite_where=_ACTIVE,
+    )
+    op.create_index(
+        "ix_h4ckath0n_devices_user_id_active",
+        "h4ckath0n_devices",
+        ["user_id"],
+        postgresql_where=_ACTIVE,
+        sqlite_where=_ACTIVE,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_h4ckath0n_devices_user_id_active", table_name="h4ckath0n_devices")
+    op.drop_index(
+        "ix_h4ckath0n_webauthn_credentials_user_id_active",
+        table_name="h4ckath0n_webauthn_credentials",
+    )
+    op.drop_index(
+        "ix_h4ckath0n_webauthn_credentials_user_id_created_at",
+        table_name="h4ckath0n_webauthn_credentials",
+    )
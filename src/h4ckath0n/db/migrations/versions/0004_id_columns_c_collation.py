@@ -0,0 +1,56 @@
+"""use the C collation for ID columns on Postgres
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2025-01-04 00:00:00.000000
+
+Postgres-only, in-place migration:
+  - Every String(32) ID column (primary keys and user_id references) switches
+    to COLLATE "C" so index lookups and joins compare bytes, not locale rules.
+  - IDs are lowercase ASCII, so equality and ordering are unchanged.
+  - Indexes on these columns are rebuilt by Postgres as part of the ALTER.
+  - Other dialects: no-op (SQLite already compares bytes).
+  - Downgrade restores the database default collation.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0004"
+down_revision: str | None = "0003"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_ID_COLUMNS: tuple[tuple[str, str, bool], ...] = (
+    ("h4ckath0n_users", "id", False),
+    ("h4ckath0n_webauthn_credentials", "id", False),
+    ("h4ckath0n_webauthn_credentials", "user_id", False),
+    ("h4ckath0n_webauthn_challenges", "user_id", True),
+    ("h4ckath0n_password_reset_tokens", "id", False),
+    ("h4ckath0n_password_reset_tokens", "user_id", False),
+    ("h4ckath0n_devices", "id", False),
+    ("h4ckath0n_devices", "user_id", False),
+)
+
+
+def _set_collation(collation: str) -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    for table, column, nullable in _ID_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            existing_type=sa.String(32),
+            type_=sa.String(32, collation=collation),
+            existing_nullable=nullable,
+        )
+
+
+def upgrade() -> None:
+    _set_collation("C")
+
+
+def downgrade() -> None:
+    _set_collation("default")
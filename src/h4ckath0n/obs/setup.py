@@ -3,11 +3,11 @@
 from __future__ import annotations
 
 import os
-import uuid
 
 from fastapi import FastAPI, Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
 
+from h4ckath0n.auth.passkeys.ids import new_token_id
 from h4ckath0n.obs.settings import ObservabilitySettings
 
 
@@ -15,7 +15,8 @@ class _TraceIdMiddleware(BaseHTTPMiddleware):
     """Attach a ``X-Trace-Id`` header to every response."""
 
     async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
-        trace_id = request.headers.get("x-trace-id", uuid.uuid4().hex)
+        # Only mint an ID when the caller did not send one.
+        trace_id = request.headers.get("x-trace-id") or new_token_id()
         request.state.trace_id = trace_id
         response = await call_next(request)
         response.headers["X-Trace-Id"] = trace_id
@@ -8,18 +8,23 @@ and calls the core verifier with the correct ``expected_aud``.
 
 from __future__ import annotations
 
+import hashlib
 import json
+import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
+from functools import lru_cache
 
 import jwt
-from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric.ec import EllipticCurvePublicKey
 from fastapi import WebSocket
 from jwt.algorithms import ECAlgorithm
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.requests import Request
 
-from h4ckath0n.auth.jwt import decode_device_token, get_unverified_kid
+from h4ckath0n.auth.jwt import LEEWAY, JWTClaims, decode_device_token, get_unverified_identity
 from h4ckath0n.auth.models import Device, User
 
 # ── Audience constants ────────────────────────────────────────────────────
@@ -51,6 +56,106 @@ class AuthError(Exception):
         super().__init__(detail)
 
 
+# ── Verified-token cache ──────────────────────────────────────────────────
+
+
+class _VerifiedTokenCache:
+    """Bounded LRU of signature-verified claims.
+
+    Entries are keyed by a digest of the raw token *and* the device's public
+    JWK, so a hit proves the exact token was already verified against the
+    exact key currently stored for the device.  Only the ES256 signature
+    check is skipped on a hit: revocation, expiry, ``aud`` and the user
+    lookup are still enforced on every call.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self._maxsize = maxsize
+        self._entries: OrderedDict[bytes, JWTClaims] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(raw_jwt: str, public_key_jwk: str) -> bytes:
+        h = hashlib.blake2b(raw_jwt.encode(), digest_size=16)
+        h.update(b"\0")
+        h.update(public_key_jwk.encode())
+        return h.digest()
+
+    def get(self, key: bytes) -> JWTClaims | None:
+        with self._lock:
+            claims = self._entries.get(key)
+            if claims is not None:
+                self._entries.move_to_end(key)
+            return claims
+
+    def put(self, key: bytes, claims: JWTClaims) -> None:
+        with self._lock:
+            self._entries[key] = claims
+            self._entries.move_to_end(key)
+            if len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def discard(self, key: bytes) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_verified_tokens = _VerifiedTokenCache(maxsize=4096)
+
+
+@lru_cache(maxsize=1024)
+def _device_public_key(public_key_jwk: str) -> EllipticCurvePublicKey:
+    """Load a stored device JWK into a key object PyJWT can verify with directly.
+
+    Cached on the JWK text itself, so a device whose key changes simply misses
+    the cache; revocation is still read from the database on every request.
+    """
+    public_key = ECAlgorithm(ECAlgorithm.SHA256).from_jwk(json.loads(public_key_jwk))
+    if not isinstance(public_key, EllipticCurvePublicKey):
+        raise ValueError("Device JWK is not an EC public key")
+    return public_key
+
+
+def _verify_signature(raw_jwt: str, public_key_jwk: str) -> JWTClaims:
+    """Verify *raw_jwt* against the device JWK, reusing earlier verifications."""
+    cache_key = _VerifiedTokenCache.key(raw_jwt, public_key_jwk)
+    claims = _verified_tokens.get(cache_key)
+    if claims is not None:
+        if claims.exp_epoch + LEEWAY.total_seconds() <= time.time():
+            _verified_tokens.discard(cache_key)
+            raise AuthError("Token expired")
+        return claims
+
+    try:
+        public_key = _device_public_key(public_key_jwk)
+    except (ValueError, KeyError, TypeError):
+        raise AuthError("Invalid device key") from None
+
+    try:
+        claims = decode_device_token(raw_jwt, public_key=public_key)
+    except jwt.ExpiredSignatureError:
+        raise AuthError("Token expired") from None
+    except jwt.InvalidTokenError:
+        raise AuthError("Invalid token") from None
+
+    _verified_tokens.put(cache_key, claims)
+    return claims
+
+
+# The device (by ``kid``) and the user (by the token's ``sub``) come back in a
+# single round trip.  The statement is built once, so each verification only
+# binds parameters.
+_DEVICE_AND_USER = (
+    select(Device, User)
+    .outerjoin(User, User.id == bindparam("sub"))
+    .where(Device.id == bindparam("kid"))
+)
+
+
 async def verify_device_jwt(
     raw_jwt: str,
     *,
@@ -78,34 +183,30 @@ async def verify_device_jwt(
     AuthError
         On any verification failure.
     """
-    kid = get_unverified_kid(raw_jwt)
+    ctx, _user = await _verify_device_jwt(raw_jwt, expected_aud=expected_aud, db=db)
+    return ctx
+
+
+async def _verify_device_jwt(
+    raw_jwt: str,
+    *,
+    expected_aud: str,
+    db: AsyncSession,
+) -> tuple[AuthContext, User]:
+    """Like :func:`verify_device_jwt`, but also return the loaded :class:`User`."""
+    kid, sub = get_unverified_identity(raw_jwt)
     if not kid:
         raise AuthError("Missing kid in JWT header")
 
-    result = await db.execute(select(Device).filter(Device.id == kid))
-    device = result.scalars().first()
-    if not device:
+    row = (await db.execute(_DEVICE_AND_USER, {"kid": kid, "sub": sub})).first()
+    if row is None:
         raise AuthError("Unknown device")
+    device, user = row
 
     if device.revoked_at is not None:
         raise AuthError("Device revoked")
 
-    try:
-        jwk_dict = json.loads(device.public_key_jwk)
-        public_key = ECAlgorithm(ECAlgorithm.SHA256).from_jwk(jwk_dict)
-        pem = public_key.public_bytes(  # type: ignore[union-attr]
-            encoding=serialization.Encoding.PEM,
-            format=serialization.PublicFormat.SubjectPublicKeyInfo,
-        ).decode()
-    except (ValueError, KeyError, TypeError):
-        raise AuthError("Invalid device key") from None
-
-    try:
-        claims = decode_device_token(raw_jwt, public_key_pem=pem)
-    except jwt.ExpiredSignatureError:
-        raise AuthError("Token expired") from None
-    except jwt.InvalidTokenError:
-        raise AuthError("Invalid token") from None
+    claims = _verify_signature(raw_jwt, device.public_key_jwk)
 
     # ── aud enforcement ───────────────────────────────────────────────
     if not claims.aud:
@@ -113,13 +214,11 @@ async def verify_device_jwt(
     if claims.aud != expected_aud:
         raise AuthError(f"Invalid aud: expected {expected_aud}")
 
-    # ── user lookup ───────────────────────────────────────────────────
-    result = await db.execute(select(User).filter(User.id == claims.sub))
-    user = result.scalars().first()
-    if user is None:
+    # ── user (loaded above by the now-verified ``sub``) ───────────────
+    if user is None or user.id != claims.sub:
         raise AuthError("User not found")
 
-    return AuthContext(user_id=user.id, device_id=device.id)
+    return AuthContext(user_id=user.id, device_id=device.id), user
 
 
 # ── Transport helpers ─────────────────────────────────────────────────────
@@ -249,6 +249,59 @@ class TestProtectedEndpoint:
         assert r.status_code == 200
         assert r.json()["email"] == "eve@example.com"
 
+    def test_one_session_per_request(self, client: TestClient, app, db_session):
+        from h4ckath0n.auth import require_user
+
+        @app.get("/protected3")
+        def protected3(user=require_user()):
+            return {"id": user.id}
+
+        user_id, device_id, private_pem = _register_user_with_device(
+            client, db_session, "olivia@example.com", "strongP@ss1"
+        )
+        factory = app.state.async_session_factory
+        opened = []
+
+        def counting_factory():
+            opened.append(1)
+            return factory()
+
+        app.state.async_session_factory = counting_factory
+        token = _make_device_token(user_id, device_id, private_pem)
+        r = client.get("/protected3", headers={"Authorization": f"Bearer {token}"})
+        assert r.status_code == 200
+        assert len(opened) == 1
+
+    def test_one_query_per_request(self, client: TestClient, app, db_session):
+        from sqlalchemy import event
+
+        from h4ckath0n.auth import require_user
+
+        @app.get("/protected4")
+        def protected4(user=require_user()):
+            return {"id": user.id, "email": user.email}
+
+        user_id, device_id, private_pem = _register_user_with_device(
+            client, db_session, "peggy@example.com", "strongP@ss1"
+        )
+        selects = []
+
+        def _record(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().upper().startswith("SELECT"):
+                selects.append(statement)
+
+        sync_engine = app.state.async_engine.sync_engine
+        event.listen(sync_engine, "before_cursor_execute", _record)
+        try:
+            token = _make_device_token(user_id, device_id, private_pem)
+            r = client.get("/protected4", headers={"Authorization": f"Bearer {token}"})
+        finally:
+            event.remove(sync_engine, "before_cursor_execute", _record)
+        assert r.status_code == 200
+        assert r.json() == {"id": user_id, "email": "peggy@example.com"}
+        # Device and user are loaded together; the route gets that same user.
+        assert len(selects) == 1
+
 
 # ---------------------------------------------------------------------------
 # Admin role gate
@@ -330,6 +383,14 @@ class TestScopeGate:
         r = client.post("/billing/refund2", headers={"Authorization": f"Bearer {token}"})
         assert r.status_code == 200
 
+    def test_dependencies_are_shared(self):
+        from h4ckath0n.auth import require_admin, require_scopes, require_user
+
+        assert require_user() is require_user()
+        assert require_admin() is require_admin()
+        assert require_scopes("a", "b") is require_scopes("a", "b")
+        assert require_scopes("a") is not require_scopes("b")
+
 
 # ---------------------------------------------------------------------------
 # No refresh/logout routes
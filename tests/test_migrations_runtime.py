@@ -30,7 +30,7 @@ class TestMigrationStatusDetection:
                 conn.execute(
                     text(f"CREATE TABLE {VERSION_TABLE} (version_num VARCHAR(32) NOT NULL)")
                 )
-                conn.execute(text(f"INSERT INTO {VERSION_TABLE} (version_num) VALUES ('0002')"))
+                conn.execute(text(f"INSERT INTO {VERSION_TABLE} (version_num) VALUES ('0004')"))
             status = get_schema_status(db_url)
             assert status.state == "at_head"
             assert status.warning is None
@@ -53,6 +53,27 @@ class TestMigrationStatusDetection:
         finally:
             engine.dispose()
 
+    async def test_async_status_matches_sync(self, tmp_path):
+        from h4ckath0n.db.engine import create_async_engine_from_settings
+        from h4ckath0n.db.migrations.runtime import get_schema_status_async
+
+        db_url = f"sqlite:///{tmp_path}/async_status.db"
+        engine = create_engine(db_url, connect_args={"check_same_thread": False})
+        try:
+            with engine.begin() as conn:
+                conn.execute(
+                    text(f"CREATE TABLE {VERSION_TABLE} (version_num VARCHAR(32) NOT NULL)")
+                )
+                conn.execute(text(f"INSERT INTO {VERSION_TABLE} (version_num) VALUES ('0001')"))
+        finally:
+            engine.dispose()
+
+        async_engine = create_async_engine_from_settings(Settings(database_url=db_url))
+        try:
+            assert await get_schema_status_async(async_engine) == get_schema_status(db_url)
+        finally:
+            await async_engine.dispose()
+
     def test_no_alembic_version_with_tables_returns_fresh(self, tmp_path):
         db_url = f"sqlite:///{tmp_path}/legacy.db"
         engine = create_engine(db_url, connect_args={"check_same_thread": False})
@@ -74,7 +95,9 @@ class TestAutoUpgradeStartup:
         settings = Settings(database_url=db_url, auto_upgrade=True)
         with patch("h4ckath0n.app.run_upgrade_to_head") as mock_upgrade:
             app = create_app(settings)
-            with patch("h4ckath0n.app.get_schema_status") as mock_status:
+            with patch(
+                "h4ckath0n.app.get_schema_status_async", new_callable=AsyncMock
+            ) as mock_status:
                 mock_status.return_value.warning = None
                 with patch("h4ckath0n.app.Base.metadata.create_all"):
                     # Trigger lifespan startup/shutdown.
@@ -89,7 +112,7 @@ class TestAutoUpgradeStartup:
         settings = Settings(database_url=db_url, auto_upgrade=False)
         app = create_app(settings)
         with (
-            patch("h4ckath0n.app.get_schema_status") as mock_status,
+            patch("h4ckath0n.app.get_schema_status_async", new_callable=AsyncMock) as mock_status,
             patch("h4ckath0n.app.Base.metadata.create_all"),
             caplog.at_level(logging.WARNING),
         ):
@@ -100,6 +123,38 @@ class TestAutoUpgradeStartup:
                 pass
         assert "database schema revision is behind code migrations" in caplog.text
 
+    def test_create_all_skipped_when_at_head(self, tmp_path):
+        db_url = f"sqlite:///{tmp_path}/at_head_startup.db"
+        app = create_app(Settings(database_url=db_url))
+        with (
+            patch("h4ckath0n.app.get_schema_status_async", new_callable=AsyncMock) as mock_status,
+            patch("h4ckath0n.app.Base.metadata.create_all") as mock_create_all,
+        ):
+            mock_status.return_value = SchemaStatus(
+                state="at_head", current_revisions=(), head_revisions=(), warning=None
+            )
+            from fastapi.testclient import TestClient
+
+            with TestClient(app):
+                pass
+        mock_create_all.assert_not_called()
+
+    def test_create_all_runs_on_fresh_database(self, tmp_path):
+        db_url = f"sqlite:///{tmp_path}/fresh_startup.db"
+        app = create_app(Settings(database_url=db_url))
+        with (
+            patch("h4ckath0n.app.get_schema_status_async", new_callable=AsyncMock) as mock_status,
+            patch("h4ckath0n.app.Base.metadata.create_all") as mock_create_all,
+        ):
+            mock_status.return_value = SchemaStatus(
+                state="fresh", current_revisions=(), head_revisions=(), warning=None
+            )
+            from fastapi.testclient import TestClient
+
+            with TestClient(app):
+                pass
+        mock_create_all.assert_called_once()
+
 
 class TestAsyncMigrationHelper:
     def test_normalize_db_url_for_sync_preserves_password_and_strips_asyncpg_query_keys(
@@ -132,3 +187,17 @@ class TestAsyncMigrationHelper:
 
         mock_to_thread.assert_awaited_once_with(run_upgrade_to_head_sync, "sqlite:///tmp/test.db")
         assert result == expected
+
+
+class TestPoolPrewarm:
+    async def test_prewarm_leaves_idle_connections_in_pool(self, tmp_path):
+        from h4ckath0n.db.engine import create_async_engine_from_settings, prewarm_async_pool
+
+        engine = create_async_engine_from_settings(
+            Settings(database_url=f"sqlite:///{tmp_path}/prewarm.db")
+        )
+        try:
+            await prewarm_async_pool(engine, 3)
+            assert engine.pool.checkedin() == 3
+        finally:
+            await engine.dispose()
@@ -11,6 +11,7 @@ Covers:
 from __future__ import annotations
 
 import json
+import os
 from datetime import UTC, datetime, timedelta
 
 import pytest
@@ -36,6 +37,7 @@ from h4ckath0n.auth.passkeys.ids import (
 from h4ckath0n.auth.passkeys.service import (
     LastPasskeyError,
     cleanup_expired_challenges,
+    list_passkey_summaries,
     list_passkeys,
     rename_passkey,
     revoke_passkey,
@@ -124,6 +126,12 @@ class TestIdGenerators:
         assert not is_user_id(uid[:31])  # too short
         assert not is_user_id(uid + "a")  # too long
 
+    def test_is_user_id_rejects_non_base32_body(self):
+        uid = new_user_id()
+        for bad in ("A", "1", "=", "\u00e9"):
+            assert not is_user_id(uid[:-1] + bad)
+        assert not is_user_id(uid + "\n")
+
     def test_is_key_id(self):
         kid = new_key_id()
         assert is_key_id(kid)
@@ -142,6 +150,48 @@ class TestIdGenerators:
         ids = {new_user_id() for _ in range(100)}
         assert len(ids) == 100  # all unique
 
+    def test_random_base32_matches_stdlib_encoding(self, monkeypatch):
+        import base64
+
+        from h4ckath0n.auth.passkeys import ids
+
+        for raw in (bytes(20), b"\xff" * 20, os.urandom(20), os.urandom(10)):
+            monkeypatch.setattr(ids, "random_bytes", lambda n, raw=raw: raw)
+            expected = base64.b32encode(raw).decode("ascii").lower()
+            assert ids.random_base32(len(raw)) == expected
+
+    def test_prefixed_ids_match_stdlib_encoding(self, monkeypatch):
+        import base64
+
+        from h4ckath0n.auth.passkeys import ids
+
+        raw = os.urandom(20)
+        monkeypatch.setattr(ids, "random_bytes", lambda n: raw)
+        body = base64.b32encode(raw).decode("ascii").lower()[1:]
+        assert ids.new_user_id() == "u" + body
+        assert ids.new_key_id() == "k" + body
+        assert ids.new_device_id() == "d" + body
+
+    def test_uniqueness_across_buffer_refills(self):
+        ids = {new_user_id() for _ in range(3000)}
+        assert len(ids) == 3000
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+    def test_forked_child_does_not_reuse_parent_buffer(self):
+        new_user_id()  # make sure this thread has a partially used buffer
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            os.write(write_fd, new_user_id().encode())
+            os._exit(0)
+        os.close(write_fd)
+        child_id = os.read(read_fd, 64).decode()
+        os.close(read_fd)
+        os.waitpid(pid, 0)
+        assert is_user_id(child_id)
+        assert child_id != new_user_id()
+
 
 # ---------------------------------------------------------------------------
 # Flow state tests (challenge lifecycle)
@@ -168,6 +218,18 @@ class TestFlowState:
         assert user is not None
         assert is_user_id(user.id)
 
+    async def test_register_start_writes_user_and_flow_in_one_flush(
+        self, db_session: AsyncSession, settings
+    ):
+        from sqlalchemy import event
+
+        flushes: list[int] = []
+        event.listen(
+            db_session.sync_session, "after_flush", lambda s, ctx: flushes.append(len(s.new))
+        )
+        await start_registration(db_session, settings)
+        assert flushes == [2]
+
     async def test_authentication_start_creates_flow(self, db_session: AsyncSession, settings):
         flow_id, options = await start_authentication(db_session, settings)
         assert flow_id
@@ -225,6 +287,63 @@ class TestFlowState:
         remaining = result.scalars().first()
         assert remaining is None
 
+    async def test_background_sweep_deletes_expired_challenges(
+        self, app, db_session: AsyncSession, settings
+    ):
+        import asyncio
+        import contextlib
+
+        from h4ckath0n.app import _sweep_expired_challenges
+
+        flow_id, _ = await start_registration(db_session, settings)
+        result = await db_session.execute(select(WebAuthnChallenge).filter_by(id=flow_id))
+        flow = result.scalars().first()
+        flow.expires_at = datetime.now(UTC) - timedelta(minutes=1)
+        await db_session.commit()
+
+        sweeper = asyncio.create_task(
+            _sweep_expired_challenges(app.state.async_session_factory, 0.01)
+        )
+        try:
+            for _ in range(100):
+                await asyncio.sleep(0.01)
+                async with app.state.async_session_factory() as db:
+                    if await db.get(WebAuthnChallenge, flow_id) is None:
+                        break
+            else:
+                pytest.fail("expired challenge was not swept")
+        finally:
+            sweeper.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await sweeper
+
+    async def test_finish_authentication_updates_counter(
+        self, db_session: AsyncSession, settings, monkeypatch
+    ):
+        from h4ckath0n.auth.passkeys import service
+
+        user = User()
+        db_session.add(user)
+        await db_session.flush()
+        cred = WebAuthnCredential(
+            user_id=user.id, credential_id="login-test", public_key=b"\x00" * 32, sign_count=3
+        )
+        db_session.add(cred)
+        await db_session.commit()
+
+        monkeypatch.setattr(service, "verify_authentication", lambda **_: ("login-test", 7))
+        flow_id, _ = await start_authentication(db_session, settings)
+        got = await service.finish_authentication(
+            db_session, flow_id, {"rawId": "login-test"}, settings
+        )
+        assert got.id == user.id
+
+        await db_session.refresh(cred)
+        assert cred.sign_count == 7
+        assert cred.last_used_at is not None
+        with pytest.raises(ValueError, match="consumed"):
+            await service._get_valid_flow(db_session, flow_id, "authenticate")
+
 
 # ---------------------------------------------------------------------------
 # Last-passkey invariant
@@ -273,6 +392,24 @@ class TestLastPasskeyInvariant:
         with pytest.raises(LastPasskeyError):
             await revoke_passkey(db_session, user, creds[1].id)
 
+    async def test_revoke_reads_credential_and_count_together(self, db_session: AsyncSession):
+        from sqlalchemy import event
+
+        user, creds = await self._create_user_with_passkeys(db_session, count=2)
+        engine = db_session.bind.sync_engine
+        statements: list[str] = []
+
+        def _record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", _record)
+        try:
+            await revoke_passkey(db_session, user, creds[0].id)
+        finally:
+            event.remove(engine, "before_cursor_execute", _record)
+        # User row lock + credential-with-count; no separate COUNT round trip.
+        assert sum(s.lstrip().upper().startswith("SELECT") for s in statements) == 2
+
     async def test_revoke_already_revoked_raises(self, db_session: AsyncSession):
         user, creds = await self._create_user_with_passkeys(db_session, count=2)
         await revoke_passkey(db_session, user, creds[0].id)
@@ -296,6 +433,14 @@ class TestLastPasskeyInvariant:
         assert len(listed) == 3
         assert all(is_key_id(c.id) for c in listed)
 
+    async def test_list_passkey_summaries_match_orm_listing(self, db_session: AsyncSession):
+        user, _ = await self._create_user_with_passkeys(db_session, count=3)
+        listed = await list_passkeys(db_session, user)
+        rows = await list_passkey_summaries(db_session, user)
+        assert [tuple(r) for r in rows] == [
+            (c.id, c.name, c.created_at, c.last_used_at, c.revoked_at) for c in listed
+        ]
+
 
 # ---------------------------------------------------------------------------
 # Route wiring tests
@@ -426,6 +571,8 @@ class TestPasskeyRevokeRoute:
             headers={"Authorization": f"Bearer {token}"},
         )
         assert r.status_code == 200
+        assert r.json() == {"message": "Passkey revoked"}
+        assert r.headers["content-type"] == "application/json"
 
     async def test_revoke_last_passkey_blocked_via_route(self, client, db_session, settings):
         user, creds, token = await self._setup_user_with_device_token(
@@ -488,6 +635,23 @@ class TestWebAuthnConfig:
         s = Settings(env="production", rp_id="example.com")
         assert s.effective_rp_id() == "example.com"
 
+    def test_options_match_py_webauthn_json(self):
+        from webauthn import generate_authentication_options, options_to_json
+        from webauthn.helpers.structs import UserVerificationRequirement
+
+        from h4ckath0n.auth.passkeys.webauthn import make_authentication_options
+
+        s = Settings()
+        challenge = os.urandom(32)
+        expected = generate_authentication_options(
+            rp_id="example.com",
+            challenge=challenge,
+            timeout=s.webauthn_ttl_seconds * 1000,
+            user_verification=UserVerificationRequirement(s.user_verification),
+        )
+        options = make_authentication_options(rp_id="example.com", challenge=challenge, settings=s)
+        assert options == json.loads(options_to_json(expected))
+
 
 # ---------------------------------------------------------------------------
 # Password auth disabled by default
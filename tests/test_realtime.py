@@ -149,6 +149,44 @@ class TestVerifyDeviceJwt:
         with pytest.raises(AuthError, match="Token expired"):
             await verify_device_jwt(token, expected_aud=AUD_HTTP, db=db_session)
 
+    async def test_missing_iat_rejected(self, db_session: AsyncSession):
+        import jwt as pyjwt
+
+        uid, did, pem = await _seed_user_and_device(db_session)
+        payload = {"sub": uid, "exp": datetime.now(UTC) + timedelta(minutes=5), "aud": AUD_HTTP}
+        token = pyjwt.encode(payload, pem, algorithm="ES256", headers={"kid": did})
+        with pytest.raises(AuthError, match="Invalid token"):
+            await verify_device_jwt(token, expected_aud=AUD_HTTP, db=db_session)
+
+    def test_claims_expose_datetime_time_claims(self):
+        from h4ckath0n.auth.jwt import decode_device_token
+
+        private_key = ec.generate_private_key(ec.SECP256R1())
+        pem = private_key.private_bytes(Encoding.PEM, PrivateFormat.PKCS8, NoEncryption())
+        token = _make_token(new_user_id(), new_device_id(), pem, aud=AUD_HTTP)
+        claims = decode_device_token(token, public_key=private_key.public_key())
+        assert claims.iat == datetime.fromtimestamp(claims.iat_epoch, UTC)
+        assert claims.exp - claims.iat == timedelta(minutes=15)
+        assert claims.exp.tzinfo is UTC
+
+    def test_public_key_pem_keyword_still_accepted(self):
+        from cryptography.hazmat.primitives.serialization import PublicFormat
+
+        from h4ckath0n.auth.jwt import decode_device_token
+
+        private_key = ec.generate_private_key(ec.SECP256R1())
+        pem = private_key.private_bytes(Encoding.PEM, PrivateFormat.PKCS8, NoEncryption())
+        public_pem = (
+            private_key.public_key()
+            .public_bytes(Encoding.PEM, PublicFormat.SubjectPublicKeyInfo)
+            .decode()
+        )
+        uid = new_user_id()
+        token = _make_token(uid, new_device_id(), pem, aud=AUD_HTTP)
+        with pytest.warns(DeprecationWarning, match="public_key_pem"):
+            claims = decode_device_token(token, public_key_pem=public_pem)
+        assert claims.sub == uid
+
     async def test_unknown_device_rejected(self, db_session: AsyncSession):
         pem, _jwk = _create_device_keypair()
         token = _make_token("u" + "a" * 31, "d" + "a" * 31, pem, aud=AUD_HTTP)
@@ -237,6 +275,33 @@ class TestStableDeviceIdentity:
         did2 = await register_device(db_session, uid, jwk2, "b")
         assert did1 != did2
 
+    async def test_new_device_stored_without_reload(self, db_session: AsyncSession):
+        from sqlalchemy import event
+
+        from h4ckath0n.auth.service import register_device
+
+        _pem, jwk = _create_device_keypair()
+        uid = new_user_id()
+        db_session.add(User(id=uid, role="user"))
+        await db_session.commit()
+
+        engine = db_session.bind.sync_engine
+        statements: list[str] = []
+
+        def _record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", _record)
+        try:
+            did = await register_device(db_session, uid, jwk, "new")
+        finally:
+            event.remove(engine, "before_cursor_execute", _record)
+
+        # Fingerprint lookup only; the new row is not re-selected after commit.
+        assert sum(s.lstrip().upper().startswith("SELECT") for s in statements) == 1
+        stored = await db_session.get(Device, did)
+        assert stored is not None and stored.user_id == uid
+
     async def test_no_jwk_returns_empty_string(self, db_session: AsyncSession):
         from h4ckath0n.auth.service import register_device
 
@@ -273,3 +338,77 @@ class TestRevokedDevice:
         token = _make_token(uid, did, pem, aud=AUD_HTTP)
         ctx = await verify_device_jwt(token, expected_aud=AUD_HTTP, db=db_session)
         assert ctx.device_id == did
+
+
+# ---------------------------------------------------------------------------
+# Verified-token cache
+# ---------------------------------------------------------------------------
+
+
+class TestVerifiedTokenCache:
+    """Cached signature checks must never bypass revocation or expiry."""
+
+    async def test_repeat_token_skips_signature_check(self, db_session: AsyncSession, monkeypatch):
+        from h4ckath0n.realtime import auth as rt_auth
+
+        uid, did, pem = await _seed_user_and_device(db_session)
+        token = _make_token(uid, did, pem, aud=AUD_HTTP)
+        await verify_device_jwt(token, expected_aud=AUD_HTTP, db=db_session)
+
+        def _fail(*args, **kwargs):
+            raise AssertionError("signature re-verified")
+
+        monkeypatch.setattr(rt_auth, "decode_device_token", _fail)
+        ctx = await verify_device_jwt(token, expected_aud=AUD_HTTP, db=db_session)
+        assert ctx.user_id == uid
+
+    async def test_cached_token_rejected_after_revocation(self, db_session: AsyncSession):
+        from sqlalchemy import select
+
+        uid, did, pem = await _seed_user_and_device(db_session)
+        token = _make_token(uid, did, pem, aud=AUD_HTTP)
+        await verify_device_jwt(token, expected_aud=AUD_HTTP, db=db_session)
+
+        result = await db_session.execute(select(Device).filter(Device.id == did))
+        result.scalars().one().revoked_at = datetime.now(UTC)
+        await db_session.commit()
+
+        with pytest.raises(AuthError, match="Device revoked"):
+            await verify_device_jwt(token, expected_aud=AUD_HTTP, db=db_session)
+
+    async def test_cached_token_rejected_after_expiry(self, db_session: AsyncSession, monkeypatch):
+        import time
+
+        from h4ckath0n.realtime import auth as rt_auth
+
+        uid, did, pem = await _seed_user_and_device(db_session)
+        token = _make_token(uid, did, pem, aud=AUD_HTTP, expire_minutes=1)
+        await verify_device_jwt(token, expected_aud=AUD_HTTP, db=db_session)
+
+        later = time.time() + 120
+        monkeypatch.setattr(rt_auth.time, "time", lambda: later)
+        with pytest.raises(AuthError, match="Token expired"):
+            await verify_device_jwt(token, expected_aud=AUD_HTTP, db=db_session)
+
+    async def test_cached_token_still_enforces_aud(self, db_session: AsyncSession):
+        uid, did, pem = await _seed_user_and_device(db_session)
+        token = _make_token(uid, did, pem, aud=AUD_HTTP)
+        await verify_device_jwt(token, expected_aud=AUD_HTTP, db=db_session)
+        with pytest.raises(AuthError, match="Invalid aud"):
+            await verify_device_jwt(token, expected_aud=AUD_WS, db=db_session)
+
+    async def test_device_key_conversion_cached(self, db_session: AsyncSession):
+        from h4ckath0n.realtime.auth import _device_public_key
+
+        uid, did, pem = await _seed_user_and_device(db_session)
+        await verify_device_jwt(
+            _make_token(uid, did, pem, aud=AUD_HTTP), expected_aud=AUD_HTTP, db=db_session
+        )
+        hits = _device_public_key.cache_info().hits
+        # A fresh token for the same device misses the token cache but not the key cache.
+        await verify_device_jwt(
+            _make_token(uid, did, pem, aud=AUD_HTTP, expire_minutes=5),
+            expected_aud=AUD_HTTP,
+            db=db_session,
+        )
+        assert _device_public_key.cache_info().hits == hits + 1